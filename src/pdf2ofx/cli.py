@@ -2,21 +2,21 @@ from __future__ import annotations
 
 import json
 import os
-import shutil
+import threading
+from collections import deque
+from concurrent.futures import CancelledError, Future
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Iterable
 
 import typer
-from dotenv import load_dotenv
 from InquirerPy import inquirer
 from InquirerPy.base.control import Choice
 from rich.console import Console
 from rich.panel import Panel
 
-from pdf2ofx.converters.ofx_emitter import emit_ofx
 from pdf2ofx.handlers.mindee_handler import infer_pdf
 from pdf2ofx.helpers.errors import Stage, StageError
 from pdf2ofx.helpers.fs import (
@@ -25,12 +25,13 @@ from pdf2ofx.helpers.fs import (
     list_pdfs,
     list_tmp_jsons,
     load_local_settings,
+    move_file,
     normalize_ofx_filename,
     open_path_in_default_app,
+    read_json,
     read_tmp_meta,
     resolve_source_path_from_meta,
     safe_delete_dir,
-    safe_write_bytes,
     save_local_settings,
     selective_tmp_cleanup,
     timestamp_slug,
@@ -46,6 +47,7 @@ from pdf2ofx.normalizers.canonicalize import NormalizationError, canonicalize_mi
 from pdf2ofx.sanity.checks import (
     SanityResult,
     compute_sanity,
+    extract_balances,
     is_clean_for_tmp_delete,
     tmp_keep_reason,
 )
@@ -65,12 +67,22 @@ def _scan_ofx_fitids(ofx_path: Path) -> dict[str, int]:
     """Scan an OFX file and return {fitid: line_number}."""
     fitid_map: dict[str, int] = {}
     try:
-        with ofx_path.open("r", encoding="utf-8") as f:
-            for line_num, line in enumerate(f, start=1):
-                stripped = line.strip()
-                if stripped.startswith("<FITID>") and stripped.endswith("</FITID>"):
-                    fitid = stripped[7:-8]
-                    fitid_map[fitid] = line_num
+        # One read; jump between <FITID> tags with bytes.find and count the
+        # newlines in between instead of decoding and stripping every line.
+        data = ofx_path.read_bytes()
+        line_num, counted = 1, 0
+        pos = data.find(b"<FITID>")
+        while pos != -1:
+            line_start = data.rfind(b"\n", 0, pos) + 1
+            line_end = data.find(b"\n", pos)
+            if line_end == -1:
+                line_end = len(data)
+            stripped = data[line_start:line_end].strip()
+            if stripped.startswith(b"<FITID>") and stripped.endswith(b"</FITID>"):
+                line_num += data.count(b"\n", counted, line_start)
+                counted = line_start
+                fitid_map[stripped[7:-8].decode("utf-8")] = line_num
+            pos = data.find(b"<FITID>", line_end)
     except Exception:
         pass
     return fitid_map
@@ -86,6 +98,9 @@ class RecoveryBackRequested(Exception):
 
 @dataclass
 class ProcessItem:
+    # Explicit __slots__ rather than dataclass(slots=True): we still support 3.9.
+    __slots__ = ("name", "statement")
+
     name: str
     statement: dict
 
@@ -129,6 +144,15 @@ def _prompt_confirm(message: str, default: bool) -> bool:
     return result == "yes"
 
 
+# Thousands separators operators may type or paste: comma, NBSP, space.
+_AMOUNT_INPUT_STRIP = str.maketrans("", "", ",\u00a0 ")
+
+
+def _parse_amount_input(text: str) -> Decimal:
+    """Parse an operator-typed amount; raises InvalidOperation when not numeric."""
+    return Decimal(text.translate(_AMOUNT_INPUT_STRIP))
+
+
 def _invert_tx_sign(tx: dict) -> None:
     """Invert transaction sign in-place. Keeps Decimal; swaps debit/credit for canonical consistency."""
     amt = tx.get("amount")
@@ -177,12 +201,13 @@ def _get_sources_to_open(
     sources: list[Path],
 ) -> list[Path]:
     stem_to_source = {s.stem: s for s in sources}
-    to_open: set[Path] = set()
+    # dict as an insertion-ordered set: first-seen order, deterministic output.
+    to_open: dict[Path, None] = {}
     for i, r in enumerate(sanity_results):
         if _sanity_needs_visual_check(r):
             path = stem_to_source.get(statements[i].name)
             if path is not None:
-                to_open.add(path)
+                to_open[path] = None
     fitid_to_stem: dict[str, str] = {}
     for item in statements:
         for tx in item.statement.get("transactions", []):
@@ -197,24 +222,29 @@ def _get_sources_to_open(
             if stem is not None:
                 path = stem_to_source.get(stem)
                 if path is not None:
-                    to_open.add(path)
+                    to_open[path] = None
     return list(to_open)
 
 
 def _load_env() -> None:
+    from dotenv import load_dotenv
+
     load_dotenv(override=False)
 
 
+_REQUIRED_ENV_VARS = ("MINDEE_V2_API_KEY", "MINDEE_MODEL_ID")
+# Mindee uploads started ahead of the PDF being processed. Each upload is
+# billed, so keep this small: aborting at PDF N costs at most N + lookahead.
+_MINDEE_LOOKAHEAD = 1
+
+
 def _preflight(dev_mode: bool) -> tuple[str | None, str | None]:
-    api_key = os.getenv("MINDEE_V2_API_KEY")
-    model_id = os.getenv("MINDEE_MODEL_ID")
+    env = os.environ
+    api_key = env.get("MINDEE_V2_API_KEY")
+    model_id = env.get("MINDEE_MODEL_ID")
     if dev_mode:
         return api_key, model_id
-    missing = []
-    if not api_key:
-        missing.append("MINDEE_V2_API_KEY")
-    if not model_id:
-        missing.append("MINDEE_MODEL_ID")
+    missing = tuple(key for key in _REQUIRED_ENV_VARS if not env.get(key))
     if missing:
         raise StageError(
             stage=Stage.PREFLIGHT,
@@ -272,11 +302,14 @@ def _resolve_account_defaults(settings: dict) -> dict:
     return defaults
 
 
+_ACCOUNT_FIELDS = ("bank_id", "currency", "account_type")
+
+
 def _collect_missing_account_fields(statements: list[ProcessItem]) -> dict[str, int]:
-    missing_counts = {"bank_id": 0, "currency": 0, "account_type": 0}
+    missing_counts = dict.fromkeys(_ACCOUNT_FIELDS, 0)
     for item in statements:
         account = item.statement.get("account") or {}
-        for field in missing_counts:
+        for field in _ACCOUNT_FIELDS:
             if not account.get(field):
                 missing_counts[field] += 1
     return {field: count for field, count in missing_counts.items() if count}
@@ -285,22 +318,27 @@ def _collect_missing_account_fields(statements: list[ProcessItem]) -> dict[str,
 def _apply_account_metadata(
     statements: list[ProcessItem], values: dict
 ) -> None:
+    fields = tuple(values.items())
     for item in statements:
-        account = item.statement.get("account") or {}
-        for field, value in values.items():
+        statement = item.statement
+        account = statement.get("account")
+        if account is None:
+            # Fresh dict per statement: it is written to below.
+            account = statement["account"] = {}
+        for field, value in fields:
             if not account.get(field):
                 account[field] = value
-        item.statement["account"] = account
 
 
 def _collect_posted_at_fallbacks(statement: dict) -> Issue | None:
     fallback_fitids: list[str] = []
-    for tx in statement.get("transactions", []):
+    append = fallback_fitids.append
+    for tx in statement.get("transactions") or ():
         source = tx.get("posted_at_source")
         if source and source != "operation":
             fitid = tx.get("fitid")
             if fitid:
-                fallback_fitids.append(fitid)
+                append(fitid)
     if not fallback_fitids:
         return None
     return Issue(
@@ -328,14 +366,82 @@ def _detect_fitid_collisions(transactions: list[dict]) -> tuple[int, list[str]]:
     return duplicate_count, duplicates
 
 
+class _InferencePrefetch:
+    """Mindee inferences for *pdf_paths*, taken in order with bounded look-ahead.
+
+    Only the PDF being taken and the next *lookahead* PDFs are ever uploaded,
+    so a run aborted early is not billed for the rest of input/. Look-ahead
+    uploads run on daemon threads: ``close()`` (or Ctrl-C) does not wait for
+    them, and an upload still in flight at exit is abandoned, though Mindee
+    may already have billed it. Nothing is started for an empty list.
+    """
+
+    def __init__(
+        self,
+        pdf_paths: list[Path],
+        api_key: str,
+        model_id: str,
+        lookahead: int = _MINDEE_LOOKAHEAD,
+    ) -> None:
+        self._api_key = api_key
+        self._model_id = model_id
+        self._lookahead = lookahead
+        self._pending = deque(pdf_paths)
+        self._futures: dict[Path, Future] = {}
+        self._closed = False
+        self._fill(lookahead + 1)
+
+    def _start(self, pdf_path: Path) -> Future:
+        future: Future = Future()
+
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(infer_pdf(self._api_key, self._model_id, pdf_path))
+            except BaseException as exc:  # surfaced by future.result()
+                future.set_exception(exc)
+
+        threading.Thread(target=run, name=f"mindee-{pdf_path.name}", daemon=True).start()
+        return future
+
+    def _fill(self, limit: int) -> None:
+        while self._pending and len(self._futures) < limit:
+            path = self._pending.popleft()
+            self._futures[path] = self._start(path)
+
+    def result(self, pdf_path: Path) -> dict[str, Any]:
+        """Wait for *pdf_path*'s response (uploading it now if it was not started).
+
+        Raises CancelledError after ``close()``.
+        """
+        if self._closed:
+            raise CancelledError(f"Mindee inference for {pdf_path.name} was cancelled.")
+        future = self._futures.pop(pdf_path, None)
+        self._fill(self._lookahead)  # next upload overlaps this one's processing
+        if future is None:
+            return infer_pdf(self._api_key, self._model_id, pdf_path)
+        return future.result()
+
+    def close(self) -> None:
+        """Drop PDFs not yet started; in-flight uploads are left to finish or die with the process."""
+        self._closed = True
+        self._pending.clear()
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+
+
 def _process_raw_pdf(
     pdf_path: Path,
     api_key: str,
     model_id: str,
     tmp_json_path: Path,
     account_defaults: dict,
+    raw: dict | None = None,
 ) -> tuple[dict, list[str], dict]:
-    raw = infer_pdf(api_key, model_id, pdf_path)
+    if raw is None:
+        raw = infer_pdf(api_key, model_id, pdf_path)
     write_json(tmp_json_path, raw)
     normalization = canonicalize_mindee(raw, account_defaults=account_defaults)
     return normalization.statement, normalization.warnings, raw
@@ -345,8 +451,7 @@ def _process_dev_canonical(
     canonical_path: Path,
     tmp_json_path: Path,
 ) -> dict:
-    with canonical_path.open("r", encoding="utf-8") as handle:
-        statement = json.load(handle)
+    statement = read_json(canonical_path)
     write_json(tmp_json_path, {"dev_mode": True})
     return statement
 
@@ -368,12 +473,16 @@ def _run_sanity_stage(
     Does **not** mutate *statement* (caller may mutate after).
     When recovery_mode=True, "Back to list" raises RecoveryBackRequested.
     """
+    # Balances come from the raw response, which edits never touch: extract
+    # them once and pass them to every recompute below.
+    raw_start, raw_end = extract_balances(raw_response)
     result = compute_sanity(
         statement=statement,
         pdf_name=pdf_name,
         extracted_count=extracted_count,
-        raw_response=raw_response,
         validation_issues=validation_issues,
+        starting_balance=raw_start,
+        ending_balance=raw_end,
     )
     render_sanity_panel(console, result)
 
@@ -382,14 +491,33 @@ def _run_sanity_stage(
 
     max_desc = 50
 
+    # Labels are rebuilt on every menu redraw. Cache per tx dict, reusing the
+    # label only while its inputs are the very same objects: edits assign new
+    # values, and equal-but-different Decimals (-12.5 / -12.50) print differently.
+    label_cache: dict[int, tuple[Any, Any, Any, Any, str]] = {}
+
     def _tx_label(i: int, tx: dict) -> str:
-        date_str = (tx.get("posted_at") or "?")[:10]
+        posted_at = tx.get("posted_at")
         amt = tx.get("amount")
+        name = tx.get("name")
+        memo = tx.get("memo")
+        hit = label_cache.get(id(tx))
+        if (
+            hit is not None
+            and hit[0] is posted_at
+            and hit[1] is amt
+            and hit[2] is name
+            and hit[3] is memo
+        ):
+            return hit[4]
+        date_str = (posted_at or "?")[:10]
         amt_str = f"{str(amt):>12}" if amt is not None else " " * 12
-        desc = (tx.get("name") or tx.get("memo") or "-").strip()
+        desc = (name or memo or "-").strip()
         if len(desc) > max_desc:
             desc = desc[: max_desc - 1] + "…"
-        return f"{date_str}  {amt_str}  {desc}"
+        label = f"{date_str}  {amt_str}  {desc}"
+        label_cache[id(tx)] = (posted_at, amt, name, memo, label)
+        return label
 
     triage_state: dict[str, set[int]] = {"valid": set(), "flagged": set()}
 
@@ -486,8 +614,9 @@ def _run_sanity_stage(
                         statement=statement,
                         pdf_name=pdf_name,
                         extracted_count=extracted_count,
-                        raw_response=raw_response,
                         validation_issues=validation_issues,
+                        starting_balance=raw_start,
+                        ending_balance=raw_end,
                     )
                     render_sanity_panel(console, result)
                     continue
@@ -553,12 +682,12 @@ def _run_sanity_stage(
                     end_bal: Decimal | None = None
                     if start_str.strip():
                         try:
-                            start_bal = Decimal(start_str.strip().replace(",", ""))
+                            start_bal = _parse_amount_input(start_str)
                         except (InvalidOperation, ValueError):
                             console.print("[yellow]Invalid starting balance — ignored[/yellow]")
                     if end_str.strip():
                         try:
-                            end_bal = Decimal(end_str.strip().replace(",", ""))
+                            end_bal = _parse_amount_input(end_str)
                         except (InvalidOperation, ValueError):
                             console.print("[yellow]Invalid ending balance — ignored[/yellow]")
 
@@ -566,10 +695,9 @@ def _run_sanity_stage(
                         statement=statement,
                         pdf_name=pdf_name,
                         extracted_count=extracted_count,
-                        raw_response=raw_response,
                         validation_issues=validation_issues,
-                        starting_balance=start_bal,
-                        ending_balance=end_bal,
+                        starting_balance=start_bal if start_bal is not None else raw_start,
+                        ending_balance=end_bal if end_bal is not None else raw_end,
                     )
                     render_sanity_panel(console, result)
                     continue
@@ -643,8 +771,9 @@ def _run_sanity_stage(
                             statement=statement,
                             pdf_name=pdf_name,
                             extracted_count=extracted_count,
-                            raw_response=raw_response,
                             validation_issues=validation_issues,
+                            starting_balance=raw_start,
+                            ending_balance=raw_end,
                         )
                         render_sanity_panel(console, result)
                         continue
@@ -685,8 +814,9 @@ def _run_sanity_stage(
                                 statement=statement,
                                 pdf_name=pdf_name,
                                 extracted_count=extracted_count,
-                                raw_response=raw_response,
                                 validation_issues=validation_issues,
+                                starting_balance=raw_start,
+                                ending_balance=raw_end,
                             )
                             render_sanity_panel(console, result)
                             continue
@@ -703,7 +833,7 @@ def _run_sanity_stage(
                         amt_str = _prompt_text("Amount:", default=amt_default)
                         if amt_str.strip():
                             try:
-                                parsed_amt = Decimal(amt_str.strip().replace(",", ""))
+                                parsed_amt = _parse_amount_input(amt_str)
                                 tx["amount"] = parsed_amt
                                 tx["trntype"] = "CREDIT" if parsed_amt >= 0 else "DEBIT"
                             except (InvalidOperation, ValueError):
@@ -716,8 +846,9 @@ def _run_sanity_stage(
                             statement=statement,
                             pdf_name=pdf_name,
                             extracted_count=extracted_count,
-                            raw_response=raw_response,
                             validation_issues=validation_issues,
+                            starting_balance=raw_start,
+                            ending_balance=raw_end,
                         )
                         render_sanity_panel(console, result)
                         continue
@@ -805,7 +936,7 @@ def _run_recovery_mode(console: Console, base_dir: Path, dev_non_interactive: bo
     recovery_candidates: list[RecoveryCandidate] = []
     for path in candidates_paths:
         try:
-            raw = json.loads(path.read_text(encoding="utf-8"))
+            raw = read_json(path)
         except (json.JSONDecodeError, OSError):
             continue
         try:
@@ -887,7 +1018,7 @@ def _run_recovery_mode(console: Console, base_dir: Path, dev_non_interactive: bo
             back_to_list = False
             for c in selected:
                 canon_path = recovery_dir / f"recover_{c.path.stem}.canonical.json"
-                statement = json.loads(canon_path.read_text(encoding="utf-8"))
+                statement = read_json(canon_path)
                 extracted = len(statement.get("transactions", []))
                 try:
                     pdf_display_name = (c.source_path.name if c.source_path else c.path.name)
@@ -947,14 +1078,16 @@ def _run_recovery_mode(console: Console, base_dir: Path, dev_non_interactive: bo
         summary_lines.append(f"  {c.path.stem}.canonical.json  →  {n} transactions")
     summary_lines.append(f"\nTotal: {total_tx} transactions → {output_dir}")
     console.print(Panel.fit("\n".join(summary_lines), title="About to convert", style="dim"))
+    # Deferred: ofxtools dominates CLI import time and is only needed to emit.
+    from pdf2ofx.converters.ofx_emitter import emit_ofx_to_path
+
     output_files: list[str] = []
     if output_mode == "A":
         for c in selected:
             canon_path = recovery_dir / f"recover_{c.path.stem}.canonical.json"
-            statement = json.loads(canon_path.read_text(encoding="utf-8"))
+            statement = read_json(canon_path)
             validation = validate_statement(statement)
             statement = validation.statement
-            payload = emit_ofx(statement, output_format)
             acct = statement.get("account", {})
             period = statement.get("period", {})
             ofx_name = normalize_ofx_filename(
@@ -963,12 +1096,12 @@ def _run_recovery_mode(console: Console, base_dir: Path, dev_non_interactive: bo
                 source_name=c.path.stem,
             )
             out_path = output_dir / ofx_name
-            safe_write_bytes(out_path, payload)
+            emit_ofx_to_path(statement, out_path, output_format)
             output_files.append(str(out_path))
     else:
         merged: dict = {}
         for c in selected:
-            st = json.loads((recovery_dir / f"recover_{c.path.stem}.canonical.json").read_text(encoding="utf-8"))
+            st = read_json(recovery_dir / f"recover_{c.path.stem}.canonical.json")
             if not merged:
                 merged = dict(st)
                 merged["transactions"] = list(st.get("transactions", []))
@@ -977,7 +1110,6 @@ def _run_recovery_mode(console: Console, base_dir: Path, dev_non_interactive: bo
         if merged:
             validation = validate_statement(merged)
             merged = validation.statement
-            payload = emit_ofx(merged, output_format)
             acct = merged.get("account", {})
             ofx_name = normalize_ofx_filename(
                 account_id=acct.get("account_id", "UNKNOWN"),
@@ -985,7 +1117,7 @@ def _run_recovery_mode(console: Console, base_dir: Path, dev_non_interactive: bo
                 source_name="concat",
             )
             out_path = output_dir / ofx_name
-            safe_write_bytes(out_path, payload)
+            emit_ofx_to_path(merged, out_path, output_format)
             output_files.append(str(out_path))
     console.print(f"[green]Wrote {len(output_files)} OFX file(s) to output/.[/green]")
 
@@ -1091,122 +1223,133 @@ def main(
                     continue
                 break
 
-            for index, source in enumerate(sources):
-                try:
-                    tmp_path = tmp_json_path(tmp_dir, source.stem)
-                    stem_to_tmp_path[source.stem] = tmp_path
+            # Mindee calls are network-bound: upload the next PDF while this one
+            # is normalized and reviewed, but never the whole of input/ up front.
+            inferences = _InferencePrefetch([] if dev_mode else sources, api_key, model_id)
+            try:
+                for index, source in enumerate(sources):
+                    try:
+                        tmp_path = tmp_json_path(tmp_dir, source.stem)
+                        stem_to_tmp_path[source.stem] = tmp_path
 
-                    if dev_mode:
-                        statement = _process_dev_canonical(source, tmp_path)
-                        per_warnings: list[str] = []
-                        raw_response: dict | None = None
-                    else:
-                        statement, per_warnings, raw_response = _process_raw_pdf(
-                            source, api_key, model_id, tmp_path, settings
-                        )
-                        write_tmp_meta(tmp_path, source)
+                        if dev_mode:
+                            statement = _process_dev_canonical(source, tmp_path)
+                            per_warnings: list[str] = []
+                            raw_response: dict | None = None
+                        else:
+                            statement, per_warnings, raw_response = _process_raw_pdf(
+                                source,
+                                api_key,
+                                model_id,
+                                tmp_path,
+                                settings,
+                                raw=inferences.result(source),
+                            )
+                            write_tmp_meta(tmp_path, source)
 
-                    json_transaction_lines[source.stem] = transaction_line_numbers(
-                        tmp_path
-                    )
+                        json_transaction_lines[source.stem] = transaction_line_numbers(
+                            tmp_path
+                        )
 
-                    statement, account_issues = _ensure_account_id(
-                        statement, settings, allow_prompt=not dev_non_interactive
-                    )
-                    issues.extend(account_issues)
-
-                    assign_fitids(statement["account"]["account_id"], statement["transactions"])
-                    posted_at_issue = _collect_posted_at_fallbacks(statement)
-                    if posted_at_issue:
-                        issues.append(posted_at_issue)
-                        pdf_notes.setdefault(source.name, []).append(
-                            f"posted_at fallback used for {posted_at_issue.count} txs"
+                        statement, account_issues = _ensure_account_id(
+                            statement, settings, allow_prompt=not dev_non_interactive
                         )
-                    extracted_count = len(statement.get("transactions", []))
-                    validation = validate_statement(statement)
-                    statement = validation.statement
-                    issues.extend(validation.issues)
+                        issues.extend(account_issues)
+
+                        assign_fitids(statement["account"]["account_id"], statement["transactions"])
+                        posted_at_issue = _collect_posted_at_fallbacks(statement)
+                        if posted_at_issue:
+                            issues.append(posted_at_issue)
+                            pdf_notes.setdefault(source.name, []).append(
+                                f"posted_at fallback used for {posted_at_issue.count} txs"
+                            )
+                        extracted_count = len(statement.get("transactions", []))
+                        validation = validate_statement(statement)
+                        statement = validation.statement
+                        issues.extend(validation.issues)
 
-                    if not statement.get("transactions"):
-                        issues.append(
-                            Issue(
-                                severity=Severity.ERROR,
-                                reason="no usable transactions after validation",
-                                count=0,
+                        if not statement.get("transactions"):
+                            issues.append(
+                                Issue(
+                                    severity=Severity.ERROR,
+                                    reason="no usable transactions after validation",
+                                    count=0,
+                                )
                             )
-                        )
+                            results.append(
+                                PdfResult(
+                                    name=source.name,
+                                    ok=False,
+                                    stage=Stage.VALIDATE.value,
+                                    message="No usable transactions after validation.",
+                                )
+                            )
+                            continue
+
+                        # ── SANITY stage ──────────────────────────
+                        try:
+                            sanity_result = _run_sanity_stage(
+                                console=console,
+                                statement=statement,
+                                pdf_name=source.name,
+                                extracted_count=extracted_count,
+                                raw_response=raw_response,
+                                validation_issues=validation.issues,
+                                dev_non_interactive=dev_non_interactive,
+                                source_path=source if not dev_mode else None,
+                            )
+                            sanity_results.append(sanity_result)
+                        except UserAbort:
+                            raise
+                        except Exception as exc:
+                            raise StageError(
+                                stage=Stage.SANITY,
+                                message=f"Sanity check failed: {exc}",
+                                hint="Check raw Mindee response in tmp/",
+                            ) from exc
+
+                        if dev_simulate_failure and index == 0:
+                            raise StageError(
+                                stage=Stage.EMIT,
+                                message="Simulated failure for dev mode.",
+                                hint="Dev flag enabled.",
+                            )
+
+                        statements.append(ProcessItem(name=source.stem, statement=statement))
+                        result_index[source.stem] = len(results)
+                        results.append(PdfResult(name=source.name, ok=True, stage="OK", message=""))
+                    except StageError as exc:
+                        result_index[source.stem] = len(results)
                         results.append(
                             PdfResult(
                                 name=source.name,
                                 ok=False,
-                                stage=Stage.VALIDATE.value,
-                                message="No usable transactions after validation.",
+                                stage=exc.stage.value,
+                                message=exc.hint or exc.message,
                             )
                         )
-                        continue
-
-                    # ── SANITY stage ──────────────────────────
-                    try:
-                        sanity_result = _run_sanity_stage(
-                            console=console,
-                            statement=statement,
-                            pdf_name=source.name,
-                            extracted_count=extracted_count,
-                            raw_response=raw_response,
-                            validation_issues=validation.issues,
-                            dev_non_interactive=dev_non_interactive,
-                            source_path=source if not dev_mode else None,
-                        )
-                        sanity_results.append(sanity_result)
-                    except UserAbort:
-                        raise
-                    except Exception as exc:
-                        raise StageError(
-                            stage=Stage.SANITY,
-                            message=f"Sanity check failed: {exc}",
-                            hint="Check raw Mindee response in tmp/",
-                        ) from exc
-
-                    if dev_simulate_failure and index == 0:
-                        raise StageError(
-                            stage=Stage.EMIT,
-                            message="Simulated failure for dev mode.",
-                            hint="Dev flag enabled.",
-                        )
-
-                    statements.append(ProcessItem(name=source.stem, statement=statement))
-                    result_index[source.stem] = len(results)
-                    results.append(PdfResult(name=source.name, ok=True, stage="OK", message=""))
-                except StageError as exc:
-                    result_index[source.stem] = len(results)
-                    results.append(
-                        PdfResult(
-                            name=source.name,
-                            ok=False,
-                            stage=exc.stage.value,
-                            message=exc.hint or exc.message,
-                        )
-                    )
-                except NormalizationError as exc:
-                    result_index[source.stem] = len(results)
-                    results.append(
-                        PdfResult(
-                            name=source.name,
-                            ok=False,
-                            stage=Stage.NORMALIZE.value,
-                            message=str(exc),
+                    except NormalizationError as exc:
+                        result_index[source.stem] = len(results)
+                        results.append(
+                            PdfResult(
+                                name=source.name,
+                                ok=False,
+                                stage=Stage.NORMALIZE.value,
+                                message=str(exc),
+                            )
                         )
-                    )
-                except ValidationError as exc:
-                    result_index[source.stem] = len(results)
-                    results.append(
-                        PdfResult(
-                            name=source.name,
-                            ok=False,
-                            stage=Stage.VALIDATE.value,
-                            message=str(exc),
+                    except ValidationError as exc:
+                        result_index[source.stem] = len(results)
+                        results.append(
+                            PdfResult(
+                                name=source.name,
+                                ok=False,
+                                stage=Stage.VALIDATE.value,
+                                message=str(exc),
+                            )
                         )
-                    )
+            finally:
+                inferences.close()
 
             if not statements:
                 issues.append(
@@ -1290,10 +1433,11 @@ def main(
                         default="OFX2",
                     )
 
+                from pdf2ofx.converters.ofx_emitter import emit_ofx_to_path
+
                 if output_mode == "A":
                     for item in statements:
                         try:
-                            payload = emit_ofx(item.statement, output_format)
                             acct = item.statement.get("account", {})
                             period = item.statement.get("period", {})
                             ofx_name = normalize_ofx_filename(
@@ -1302,7 +1446,7 @@ def main(
                                 source_name=item.name,
                             )
                             out_path = output_dir / ofx_name
-                            safe_write_bytes(out_path, payload)
+                            emit_ofx_to_path(item.statement, out_path, output_format)
                             output_files.append(str(out_path))
                             fitid_lines.update(_scan_ofx_fitids(out_path))
                         except Exception as exc:
@@ -1324,10 +1468,13 @@ def main(
                                 )
                 else:
                     merged = statements[0].statement
+                    merged_account_id = (
+                        merged.get("account") or {}
+                    ).get("account_id")
                     for extra in statements[1:]:
                         if (
-                            extra.statement.get("account", {}).get("account_id")
-                            != merged.get("account", {}).get("account_id")
+                            (extra.statement.get("account") or {}).get("account_id")
+                            != merged_account_id
                         ):
                             issues.append(
                                 Issue(
@@ -1353,7 +1500,9 @@ def main(
                                 count=collision_count,
                             )
                         )
-                    validation = validate_statement(merged)
+                    # Each statement was validated in the per-PDF loop; only
+                    # the cross-statement checks (FITID uniqueness, period) remain.
+                    validation = validate_statement(merged, skip_transaction_checks=True)
                     merged = validation.statement
                     issues.extend(validation.issues)
                     if collision_count:
@@ -1369,7 +1518,6 @@ def main(
                             if id(tx) not in validated_ids and tx.get("fitid") in collision_set:
                                 merged["transactions"].append(tx)
                     try:
-                        payload = emit_ofx(merged, output_format)
                         acct = merged.get("account", {})
                         concat_name = normalize_ofx_filename(
                             account_id=acct.get("account_id", "UNKNOWN"),
@@ -1377,7 +1525,7 @@ def main(
                             source_name="concat",
                         )
                         out_path = output_dir / concat_name
-                        safe_write_bytes(out_path, payload)
+                        emit_ofx_to_path(merged, out_path, output_format)
                         output_files.append(str(out_path))
                         fitid_lines.update(_scan_ofx_fitids(out_path))
                     except Exception as exc:
@@ -1456,23 +1604,21 @@ def main(
                 moved_ok = 0
                 moved_fail = 0
                 skipped_locked = 0
+                # Each run dir is created on its first move, inside the guarded
+                # block, so it only exists if a file lands there.
+                created_dirs: set[Path] = set()
                 for source_path, result in zip(sources, results):
                     if not source_path.exists():
                         continue
+                    dest_dir = processed_dir if result.ok else failed_dir
                     try:
+                        if dest_dir not in created_dirs:
+                            dest_dir.mkdir(parents=True, exist_ok=True)
+                            created_dirs.add(dest_dir)
+                        move_file(source_path, dest_dir / source_path.name)
                         if result.ok:
-                            processed_dir.mkdir(parents=True, exist_ok=True)
-                            shutil.move(
-                                str(source_path),
-                                str(processed_dir / source_path.name),
-                            )
                             moved_ok += 1
                         else:
-                            failed_dir.mkdir(parents=True, exist_ok=True)
-                            shutil.move(
-                                str(source_path),
-                                str(failed_dir / source_path.name),
-                            )
                             moved_fail += 1
                     except PermissionError:
                         skipped_locked += 1
@@ -1491,16 +1637,15 @@ def main(
 
             fitid_to_json: dict[str, tuple[str, int, int]] = {}
             for item in statements:
-                lines_list = json_transaction_lines.get(item.name, [])
+                lines_list = json_transaction_lines.get(item.name) or ()
+                n_lines = len(lines_list)
                 tmp_path = stem_to_tmp_path.get(item.name)
-                for idx, tx in enumerate(item.statement.get("transactions", [])):
+                path_str = str(tmp_path) if tmp_path else ""
+                for one_based, tx in enumerate(item.statement.get("transactions") or (), 1):
                     fid = tx.get("fitid")
-                    if not fid:
-                        continue
-                    one_based = idx + 1
-                    json_line = lines_list[idx] if idx < len(lines_list) else 0
-                    path_str = str(tmp_path) if tmp_path else ""
-                    fitid_to_json[fid] = (path_str, one_based, json_line)
+                    if fid:
+                        json_line = lines_list[one_based - 1] if one_based <= n_lines else 0
+                        fitid_to_json[fid] = (path_str, one_based, json_line)
 
             render_summary(
                 console,
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Literal
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator, Literal
 from xml.etree import ElementTree as ET
 
 from ofxtools.Client import OFXClient
+from ofxtools.header import make_header
 from ofxtools.models import (
     BANKACCTFROM,
     BANKMSGSRSV1,
@@ -20,6 +23,8 @@ from ofxtools.models import (
 from ofxtools.models.bank.msgsets import STMTTRNRS
 from ofxtools.models.bank.stmt import LEDGERBAL
 
+from pdf2ofx.helpers.fs import atomic_write
+
 OFXFormat = Literal["OFX2", "OFX1"]
 
 _OFX_NAME_MAX = 32
@@ -42,22 +47,18 @@ def _split_name_memo(
     """Ensure NAME fits the OFX 32-char limit; overflow goes to MEMO."""
     if not name or len(name) <= _OFX_NAME_MAX:
         return name, memo
-    # Try to truncate at a word boundary (keep at least 10 chars)
-    truncated = name[:_OFX_NAME_MAX]
-    last_space = truncated.rfind(" ")
-    if last_space > 10:
-        truncated = truncated[:last_space]
+    # Truncate at a word boundary (keep at least 10 chars); search only the
+    # part that survives the cut.
+    last_space = name.rfind(" ", 11, _OFX_NAME_MAX)
+    truncated = name[:last_space] if last_space != -1 else name[:_OFX_NAME_MAX]
     # Full description goes to MEMO
-    if memo:
-        full_memo = f"{name} | {memo}"
-    else:
-        full_memo = name
-    if len(full_memo) > _OFX_MEMO_MAX:
-        full_memo = full_memo[:_OFX_MEMO_MAX]
-    return truncated, full_memo
+    full_memo = name + " | " + memo if memo else name
+    return truncated, full_memo[:_OFX_MEMO_MAX]
 
 
+@lru_cache(maxsize=1024)
 def _to_datetime(value: str) -> datetime:
+    # Pure and returns an immutable datetime; statements repeat a few dates.
     parsed = datetime.fromisoformat(value)
     if parsed.tzinfo is None:
         return parsed.replace(tzinfo=timezone.utc)
@@ -132,11 +133,58 @@ def _build_ofx(statement: dict) -> OFX:
     return OFX(signonmsgsrsv1=signon, bankmsgsrsv1=bankmsgsrsv1)
 
 
+@lru_cache(maxsize=2)
+def _client_for(fmt: OFXFormat) -> OFXClient:
+    # Serialization reads only version/prettyprint/close_elements, so one
+    # client per format can be shared across statements.
+    if fmt == "OFX2":
+        return OFXClient(url="", version=200, prettyprint=True, close_elements=True)
+    return OFXClient(url="", version=102, prettyprint=True, close_elements=False)
+
+
+def _iter_sgml(elem: ET.Element) -> Iterator[str]:
+    """Yield the SGML text of *elem*: aggregates get closing tags, leaves do not."""
+    if len(elem) == 0:
+        yield f"<{elem.tag}>{elem.text or ''}{elem.tail or ''}"
+        return
+    yield f"<{elem.tag}>{elem.text or ''}"
+    for child in elem:
+        yield from _iter_sgml(child)
+    yield f"</{elem.tag}>{elem.tail or ''}"
+
+
+def _serialize_ofx1(ofx: OFX) -> bytes:
+    """Same bytes as ``_client_for("OFX1").serialize(ofx)``, built in one join."""
+    client = _client_for("OFX1")
+    tree = ofx.to_etree()
+    ET.indent(tree)
+    header = str(make_header(version=client.version))
+    # _iter_sgml instead of ofxtools' tostring_unclosed_elements, which
+    # rebuilds the byte string at every level of the tree.
+    return (header + "".join(_iter_sgml(tree))).encode("utf_8")
+
+
 def emit_ofx(statement: dict, fmt: OFXFormat = "OFX2") -> bytes:
     ofx = _build_ofx(statement)
-    if fmt == "OFX2":
-        client = OFXClient(url="", version=200, prettyprint=True, close_elements=True)
-        return client.serialize(ofx)
+    if fmt != "OFX2":
+        return _serialize_ofx1(ofx)
+    return _client_for("OFX2").serialize(ofx)
 
-    client = OFXClient(url="", version=102, prettyprint=True, close_elements=False)
-    return client.serialize(ofx)
+
+def emit_ofx_to_path(statement: dict, path: Path, fmt: OFXFormat = "OFX2") -> None:
+    """Like :func:`emit_ofx`, but write atomically to *path* without building the payload.
+
+    OFX2 streams the element tree straight into the file (same bytes as
+    ``OFXClient.serialize``). OFX1 is serialized in memory first.
+    """
+    ofx = _build_ofx(statement)
+    with atomic_write(path) as handle:
+        if fmt != "OFX2":
+            handle.write(_serialize_ofx1(ofx))
+            return
+        client = _client_for("OFX2")
+        handle.write(str(make_header(version=client.version)).encode("utf_8"))
+        tree = ofx.to_etree()
+        ET.indent(tree)
+        # method="html" skips the XML declaration; the OFX header carries it.
+        ET.ElementTree(tree).write(handle, encoding="utf_8", method="html")
@@ -0,0 +1,21 @@
+"""Shared Decimal constant and conversion used by the normalize, validate and sanity stages."""
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any
+
+ZERO = Decimal(0)
+
+
+def to_decimal(value: Any) -> Decimal:
+    """Decimal for *value*; raises like ``Decimal(str(value))`` when it cannot be parsed.
+
+    Decimals are returned as-is and exact ints convert directly (``type(value) is int``
+    so bools still go through ``str()`` and are rejected). Anything else goes through
+    ``str()``, which keeps floats at their short repr instead of the binary expansion.
+    """
+    if isinstance(value, Decimal):
+        return value
+    if type(value) is int:
+        return Decimal(value)
+    return Decimal(str(value))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import errno
 import hashlib
 import json
 import os
@@ -7,9 +8,52 @@ import re
 import shutil
 import subprocess
 import sys
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Callable, Iterator
+
+try:  # Optional writer accelerator (pip install "pdf2ofx[fast]"); stdlib json otherwise.
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+_ORJSON_OPTIONS = (
+    # Match json.dumps(indent=2, ensure_ascii=False): 2-space indent, int keys
+    # coerced to str, and dates/dataclasses routed to `default` (stdlib rejects them).
+    orjson.OPT_INDENT_2
+    | orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None
+    else 0
+)
+
+
+def _json_dumps(payload: Any, default: Callable[[Any], Any] | None = None) -> bytes:
+    """Serialize as 2-space-indented UTF-8 JSON (orjson when installed).
+
+    Payloads orjson rejects, such as ints outside 64 bits, are re-encoded with
+    stdlib json. Output differs from stdlib in float spelling (``1e-7`` vs
+    ``1e-07``) and in NaN/Infinity, which orjson writes as ``null``.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, default=default, option=_ORJSON_OPTIONS)
+        except TypeError:  # orjson.JSONEncodeError subclasses TypeError
+            pass
+    return json.dumps(payload, ensure_ascii=False, indent=2, default=default).encode("utf-8")
+
+
+def _json_loads(data: bytes | str) -> Any:
+    """Parse JSON with stdlib json; invalid input raises json.JSONDecodeError.
+
+    Not orjson: it reads ints wider than 64 bits back as floats and rejects a
+    UTF-8 BOM and NaN/Infinity, all of which stdlib keeps.
+    """
+    return json.loads(data)
 
 
 def open_path_in_default_app(path: Path) -> None:
@@ -49,8 +93,33 @@ def ensure_dirs(base_dir: Path) -> dict[str, Path]:
     return paths
 
 
+def _has_suffix(name: str, suffix: str) -> bool:
+    """Case-insensitive *suffix* (lowercase) test; lowercases only mixed-case names.
+
+    Like ``Path.suffix``, a name that is only the suffix (e.g. ``.pdf``) does not match.
+    """
+    return len(name) > len(suffix) and (
+        name.endswith(suffix)
+        or name.endswith(suffix.upper())
+        or name.lower().endswith(suffix)
+    )
+
+
 def list_pdfs(input_dir: Path) -> list[Path]:
-    return sorted([p for p in input_dir.iterdir() if p.suffix.lower() == ".pdf"])
+    # scandir: names and d_type come straight from readdir. Sort the plain
+    # names and build Paths only for the result; normcase keeps the
+    # case-insensitive order Path comparison gives on Windows.
+    with os.scandir(input_dir) as entries:
+        names = [
+            entry.name
+            for entry in entries
+            if _has_suffix(entry.name, ".pdf") and entry.is_file()
+        ]
+    names.sort(key=os.path.normcase)
+    return [input_dir / name for name in names]
+
+
+_TMP_SIDECAR_SUFFIXES = (".raw.json", ".canonical.json", ".meta.json")
 
 
 def list_tmp_jsons(tmp_dir: Path) -> list[Path]:
@@ -62,21 +131,21 @@ def list_tmp_jsons(tmp_dir: Path) -> list[Path]:
 
     Returns sorted list of Paths. Does not create tmp_dir.
     """
-    if not tmp_dir.exists():
+    # scandir is not recursive, so tmp/recovery/** is never visited. Like
+    # list_pdfs, filter and sort plain names and build Paths only at the end.
+    try:
+        with os.scandir(tmp_dir) as entries:
+            names = [
+                entry.name
+                for entry in entries
+                if _has_suffix(entry.name, ".json")
+                and not entry.name.endswith(_TMP_SIDECAR_SUFFIXES)
+                and entry.is_file()
+            ]
+    except FileNotFoundError:
         return []
-    recovery_dir = tmp_dir / "recovery"
-    candidates: list[Path] = []
-    for p in tmp_dir.iterdir():
-        if not p.is_file() or p.suffix.lower() != ".json":
-            continue
-        if recovery_dir in p.parents or p.parent == recovery_dir:
-            continue
-        if p.name.endswith(".raw.json") or p.name.endswith(".canonical.json"):
-            continue
-        if p.name.endswith(".meta.json"):
-            continue
-        candidates.append(p)
-    return sorted(candidates)
+    names.sort(key=os.path.normcase)
+    return [tmp_dir / name for name in names]
 
 
 def ensure_recovery_dir(tmp_dir: Path) -> Path:
@@ -97,21 +166,22 @@ def selective_tmp_cleanup(
     """
     kept: list[str] = []
     for path, keep_reason in path_keep_reasons:
-        if not path.exists():
-            continue
         if keep_reason is None:
+            # unlink() reports a missing file itself; no exists() stat first.
             try:
                 path.unlink()
+            except FileNotFoundError:
+                pass
             except OSError:
                 kept.append(f"{path.name} — could not delete")
-        else:
+        elif path.exists():
             kept.append(f"{path.name} — {keep_reason}")
     return kept
 
 
 def tmp_json_path(tmp_dir: Path, source_stem: str) -> Path:
     """Return a short, clickable tmp JSON path (no spaces, fixed length)."""
-    slug = hashlib.sha256(source_stem.encode()).hexdigest()[:12]
+    slug = hashlib.blake2b(source_stem.encode(), digest_size=6).hexdigest()
     return tmp_dir / f"{slug}.json"
 
 
@@ -131,18 +201,15 @@ def write_tmp_meta(tmp_json_path: Path, source_pdf_path: Path) -> None:
         "source_pdf_path": str(source_pdf_path.resolve()),
         "source_name": source_pdf_path.name,
     }
-    with meta_path.open("w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+    meta_path.write_bytes(_json_dumps(payload))
 
 
 def read_tmp_meta(tmp_json_path: Path) -> dict | None:
     """Read provenance sidecar for a tmp JSON. Returns dict with source_pdf_path, source_name or None."""
     meta_path = _meta_path_for_tmp_json(tmp_json_path)
-    if not meta_path.exists():
-        return None
     try:
-        with meta_path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        # A missing sidecar is FileNotFoundError; no separate exists() stat.
+        data = _json_loads(meta_path.read_bytes())
     except (json.JSONDecodeError, OSError):
         return None
     if not isinstance(data, dict) or "source_pdf_path" not in data or "source_name" not in data:
@@ -168,18 +235,27 @@ def resolve_source_path_from_meta(
         p = Path(raw_path)
         if p.exists():
             return p
-    if processed_dir.exists():
-        for sub in processed_dir.iterdir():
-            if sub.is_dir():
-                candidate = sub / source_name
-                if candidate.exists():
-                    return candidate
+    # scandir gives is_dir() from d_type; iterdir() + is_dir() stats each entry.
+    try:
+        with os.scandir(processed_dir) as entries:
+            subdirs = [entry.path for entry in entries if entry.is_dir()]
+    except FileNotFoundError:
+        subdirs = []
+    for sub in subdirs:
+        candidate = Path(sub, source_name)
+        if candidate.exists():
+            return candidate
     candidate = input_dir / source_name
     if candidate.exists():
         return candidate
     return None
 
 
+def read_json(path: Path) -> Any:
+    """Load a JSON file (orjson when installed). Raises json.JSONDecodeError / OSError."""
+    return _json_loads(path.read_bytes())
+
+
 def write_json(path: Path, payload: Any, *, decimal_to_str: bool = False) -> None:
     """Write payload as JSON. When decimal_to_str=True, Decimal is serialized as string; other non-serializable types raise TypeError."""
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -189,40 +265,67 @@ def write_json(path: Path, payload: Any, *, decimal_to_str: bool = False) -> Non
             return str(o)
         raise TypeError(f"Object of type {o.__class__.__name__!r} is not JSON serializable")
 
-    kwargs: dict[str, Any] = {"ensure_ascii": False, "indent": 2}
-    if decimal_to_str:
-        kwargs["default"] = default
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, **kwargs)
+    path.write_bytes(_json_dumps(payload, default if decimal_to_str else None))
 
 
-def safe_write_bytes(path: Path, payload: bytes) -> None:
+# Streamed writers (ElementTree) issue many small writes; a 1 MiB buffer
+# turns a typical OFX file into a single write syscall.
+_ATOMIC_WRITE_BUFFER = 1 << 20
+
+
+@contextmanager
+def atomic_write(path: Path) -> Iterator[BinaryIO]:
+    """Yield a binary handle on ``<path>.tmp``; replace *path* with it on success.
+
+    On error the partial temp file is removed and *path* is left untouched.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp_path = path.with_suffix(path.suffix + ".tmp")
-    with tmp_path.open("wb") as handle:
-        handle.write(payload)
+    try:
+        with tmp_path.open("wb", buffering=_ATOMIC_WRITE_BUFFER) as handle:
+            yield handle
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
     tmp_path.replace(path)
 
 
+def safe_write_bytes(path: Path, payload: bytes) -> None:
+    with atomic_write(path) as handle:
+        handle.write(payload)
+
+
+def move_file(src: Path, dst: Path) -> None:
+    """Move *src* to *dst*: a rename on the same filesystem, copy+delete across devices."""
+    try:
+        os.replace(src, dst)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        shutil.move(str(src), str(dst))
+
+
 def safe_delete_dir(path: Path) -> None:
-    if path.exists():
+    try:
         shutil.rmtree(path)
+    except FileNotFoundError:
+        # Only a missing *path* is fine; a child vanishing mid-delete is not.
+        if path.exists():
+            raise
 
 
 def load_local_settings(path: Path) -> dict[str, Any]:
     if not path.exists():
         return {}
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
+        return _json_loads(path.read_bytes())
     except json.JSONDecodeError:
         return {}
 
 
 def save_local_settings(path: Path, payload: dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, ensure_ascii=False, indent=2)
+    path.write_bytes(_json_dumps(payload))
 
 
 def timestamp_slug() -> str:
@@ -231,6 +334,16 @@ def timestamp_slug() -> str:
     return datetime.now().strftime("%Y%m%d-%H%M%S")
 
 
+# ASCII-only deletion tables; non-ASCII input falls back to the regex path.
+_ASCII = [chr(c) for c in range(128)]
+_DROP_NON_ALNUM = str.maketrans("", "", "".join(c for c in _ASCII if not c.isalnum()))
+_DROP_NON_DIGIT_DASH = str.maketrans(
+    "", "", "".join(c for c in _ASCII if c not in "0123456789-")
+)
+_ID_CLEAN = re.compile(r"[^a-zA-Z0-9]")
+_PERIOD_CLEAN = re.compile(r"[^0-9\-]")
+
+
 def normalize_ofx_filename(
     account_id: str,
     period_end: str,
@@ -247,9 +360,15 @@ def normalize_ofx_filename(
     avoids collisions when the same account/period is processed twice
     from different source PDFs.
     """
-    uid = hashlib.sha256(source_name.encode()).hexdigest()[:4]
-    clean_id = re.sub(r"[^a-zA-Z0-9]", "", account_id)
-    clean_period = re.sub(r"[^0-9\-]", "", period_end)
+    uid = hashlib.blake2b(source_name.encode(), digest_size=2).hexdigest()
+    if account_id.isascii():
+        clean_id = account_id.translate(_DROP_NON_ALNUM)
+    else:
+        clean_id = _ID_CLEAN.sub("", account_id)
+    if period_end.isascii():
+        clean_period = period_end.translate(_DROP_NON_DIGIT_DASH)
+    else:
+        clean_period = _PERIOD_CLEAN.sub("", period_end)
     stem = f"{clean_id}_{clean_period}_{uid}"
     max_stem = max_len - 4  # leave room for ".ofx"
     if len(stem) > max_stem:
@@ -262,58 +381,154 @@ def transaction_line_numbers(json_path: Path) -> list[int]:
 
     Supports V2 (inference.result.fields.transactions.items) and V1
     (prediction.Transactions). Returns [] if structure is missing or invalid.
+
+    Results are memoized on (path, mtime_ns, size), so a rewritten file is
+    rescanned; ``clear_transaction_line_cache()`` drops the cache.
     """
-    if not json_path.exists():
-        return []
     try:
-        with json_path.open("r", encoding="utf-8") as f:
-            raw = json.load(f)
-    except (json.JSONDecodeError, OSError):
+        st = json_path.stat()
+    except OSError:
         return []
+    return list(_transaction_line_numbers_cached(str(json_path), st.st_mtime_ns, st.st_size))
+
+
+@lru_cache(maxsize=64)
+def _transaction_line_numbers_cached(
+    path_str: str, mtime_ns: int, size: int
+) -> tuple[int, ...]:
+    return tuple(_scan_transaction_line_numbers(Path(path_str)))
+
+
+def clear_transaction_line_cache() -> None:
+    """Forget memoized ``transaction_line_numbers`` results."""
+    _transaction_line_numbers_cached.cache_clear()
+
+
+_JSON_WS = re.compile(r"[ \t\n\r]*")
+_json_scan_once = json.JSONDecoder().scan_once
+
+
+@dataclass
+class _KeyTrie:
+    """Key-path trie node: the path ending here (if any) and all paths below."""
+
+    children: dict[str, _KeyTrie] = field(default_factory=dict)
+    leaf: tuple[str, ...] | None = None
+    paths: list[tuple[str, ...]] = field(default_factory=list)
+
+
+def _json_skip_value(text: str, idx: int) -> int:
+    """End index of the JSON value starting at *idx* (decoded by C ``scan_once``)."""
+    return _json_scan_once(text, idx)[1]
+
 
-    items: list[Any] = []
+def _json_walk_item_offsets(
+    text: str,
+    idx: int,
+    node: _KeyTrie,
+    found: dict[tuple[str, ...], list[int]],
+) -> int:
+    """Walk the JSON value at *idx* along the key trie *node*; return its end index.
+
+    A node with a ``leaf`` path expects an array there: each element's offset
+    is stored in *found* under that path. Values off the trie are skipped
+    with one ``scan_once`` each and matched values are walked, never both, so
+    every byte is decoded at most once. Keys are read with the json module's
+    own string scanner, so formatting (indent, compact, CRLF) does not
+    matter. Like ``json.loads``, the last duplicate key wins.
+    """
+    if node.leaf is not None:
+        offsets: list[int] = []
+        found[node.leaf] = offsets
+        if not text.startswith("[", idx):
+            return _json_skip_value(text, idx)
+        idx = _JSON_WS.match(text, idx + 1).end()
+        if text.startswith("]", idx):
+            return idx + 1
+        while True:
+            offsets.append(idx)
+            idx = _JSON_WS.match(text, _json_skip_value(text, idx)).end()
+            if not text.startswith(",", idx):
+                return idx + 1
+            idx = _JSON_WS.match(text, idx + 1).end()
+
+    if not text.startswith("{", idx):
+        return _json_skip_value(text, idx)
+    idx = _JSON_WS.match(text, idx + 1).end()
+    if text.startswith("}", idx):
+        return idx + 1
+    while True:
+        key, idx = json.decoder.scanstring(text, idx + 1)
+        idx = _JSON_WS.match(text, idx).end()  # before ':'
+        idx = _JSON_WS.match(text, idx + 1).end()
+        child = node.children.get(key)
+        if child is None:
+            idx = _json_skip_value(text, idx)
+        else:
+            for path in child.paths:  # a repeated key replaces earlier matches
+                found.pop(path, None)
+            idx = _json_walk_item_offsets(text, idx, child, found)
+        idx = _JSON_WS.match(text, idx).end()
+        if not text.startswith(",", idx):
+            return idx + 1
+        idx = _JSON_WS.match(text, idx + 1).end()
+
+
+# Where Mindee puts the transaction list, in lookup order.
+_TRANSACTION_ITEM_PATHS: tuple[tuple[str, ...], ...] = (
     # V2: inference.result.fields.transactions.items
-    tr = (raw.get("inference") or {}).get("result") or {}
-    tr = (tr.get("fields") or {}).get("transactions") or {}
-    if isinstance(tr, dict):
-        items = tr.get("items") or []
+    ("inference", "result", "fields", "transactions", "items"),
     # V1: document.inference.prediction.Transactions or inference.prediction
-    if not isinstance(items, list) or len(items) == 0:
-        inf = (raw.get("document") or {}).get("inference") or raw.get("inference") or {}
-        pred = inf.get("prediction") or {}
-        items = pred.get("Transactions") or pred.get("transactions") or []
-    if not isinstance(items, list) or len(items) == 0:
-        return []
+    ("document", "inference", "prediction", "Transactions"),
+    ("document", "inference", "prediction", "transactions"),
+    ("inference", "prediction", "Transactions"),
+    ("inference", "prediction", "transactions"),
+)
+
+
+def _build_key_trie(paths: tuple[tuple[str, ...], ...]) -> _KeyTrie:
+    root = _KeyTrie(paths=list(paths))
+    for path in paths:
+        node = root
+        for key in path:
+            node = node.children.setdefault(key, _KeyTrie())
+            node.paths.append(path)
+        node.leaf = path
+    return root
+
 
-    count = len(items)
-    with json_path.open("r", encoding="utf-8") as f:
-        lines = f.readlines()
-
-    # Find the array start line: "items": [ (V2) or "Transactions": [ (V1)
-    start_idx: int | None = None
-    for i, line in enumerate(lines):
-        if '"items": [' in line and i > 0 and "transactions" in lines[i - 1]:
-            start_idx = i
-            break
-    if start_idx is None:
-        for i, line in enumerate(lines):
-            if '"Transactions": [' in line:
-                start_idx = i
-                break
-    if start_idx is None:
+_TRANSACTION_ITEM_TRIE = _build_key_trie(_TRANSACTION_ITEM_PATHS)
+
+
+def _scan_transaction_line_numbers(json_path: Path) -> list[int]:
+    # One read and one walk that checks every candidate path together;
+    # values off those paths are skipped, not kept.
+    try:
+        text = json_path.read_bytes().decode("utf-8")
+    except (OSError, UnicodeDecodeError):
+        return []
+    found: dict[tuple[str, ...], list[int]] = {}
+    try:
+        _json_walk_item_offsets(text, _JSON_WS.match(text).end(), _TRANSACTION_ITEM_TRIE, found)
+    except (StopIteration, ValueError):
         return []
+    for path in _TRANSACTION_ITEM_PATHS:
+        offsets = found.get(path)
+        if offsets:
+            return _offsets_to_line_numbers(text, offsets)
+    return []
+
 
-    # From the line after the "[", find lines that are only whitespace + "{"
-    indent_len: int | None = None
+def _offsets_to_line_numbers(text: str, offsets: list[int]) -> list[int]:
+    """1-based line number of each offset in *text*; *offsets* must be ascending.
+
+    Each newline is counted once (C-level str.count between consecutive
+    offsets), so this is O(len(text)) overall with no per-file index.
+    """
     result: list[int] = []
-    for k in range(start_idx + 1, len(lines)):
-        if len(result) >= count:
-            break
-        s = lines[k]
-        stripped = s.strip()
-        if stripped == "{":
-            if indent_len is None:
-                indent_len = len(s) - len(s.lstrip())
-            if indent_len is not None and (len(s) - len(s.lstrip())) == indent_len:
-                result.append(k + 1)
+    line_no, prev = 1, 0
+    for off in offsets:
+        line_no += text.count("\n", prev, off)
+        prev = off
+        result.append(line_no)
     return result
@@ -6,20 +6,25 @@ from dataclasses import dataclass
 
 @dataclass
 class Timer:
-    start: float | None = None
-    end: float | None = None
+    # Integer nanoseconds from perf_counter_ns; converted to seconds on read.
+    start: int | None = None
+    end: int | None = None
 
     def __enter__(self) -> "Timer":
-        self.start = time.perf_counter()
+        self.start = time.perf_counter_ns()
         return self
 
     def __exit__(self, exc_type, exc, tb) -> None:
-        self.end = time.perf_counter()
+        self.end = time.perf_counter_ns()
 
     @property
-    def elapsed(self) -> float:
+    def elapsed_ns(self) -> int:
         if self.start is None:
-            return 0.0
+            return 0
         if self.end is None:
-            return time.perf_counter() - self.start
+            return time.perf_counter_ns() - self.start
         return self.end - self.start
+
+    @property
+    def elapsed(self) -> float:
+        return self.elapsed_ns / 1e9
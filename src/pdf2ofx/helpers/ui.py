@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Iterable
 
@@ -15,6 +16,8 @@ if TYPE_CHECKING:
 
 @dataclass
 class PdfResult:
+    __slots__ = ("name", "ok", "stage", "message")
+
     name: str
     ok: bool
     stage: str
@@ -35,6 +38,13 @@ def _truncate(text: str, max_len: int = _PDF_NAME_MAX) -> str:
     return text[: max_len - 1] + "…"
 
 
+@lru_cache(maxsize=128)
+def _display_json_path(path_str: str) -> str:
+    # Every FITID from one tmp JSON shares the same path; shorten it once.
+    short = Path(path_str)
+    return f"{short.parent.name}/{_truncate(short.name, 45)}"
+
+
 def _format_fitid(
     fitid: str,
     fitid_lines: dict[str, int] | None,
@@ -52,9 +62,7 @@ def _format_fitid(
     if json_info:
         _, _, json_line = json_info
         if json_line > 0:
-            short = Path(path_str)
-            display_path = f"{short.parent.name}/{_truncate(short.name, 45)}"
-            parts.append(f"· {display_path}:{json_line}")
+            parts.append(f"· {_display_json_path(path_str)}:{json_line}")
     if len(parts) == 1:
         return fitid
     return " ".join(parts)
@@ -80,11 +88,13 @@ def render_summary(
     table.add_column("Stage")
     table.add_column("Hint")
 
-    processed = 0
-    for result in results:
-        processed += 1
-        status = "OK" if result.ok else "FAIL"
-        table.add_row(_truncate(result.name), status, result.stage, result.message)
+    rows = [
+        (_truncate(result.name), "OK" if result.ok else "FAIL", result.stage, result.message)
+        for result in results
+    ]
+    processed = len(rows)
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
     console.print(
@@ -99,16 +109,20 @@ def render_summary(
     if output_files:
         console.print(Panel.fit("\n".join(output_files), title="Generated OFX"))
 
-    warning_count = sum(
-        issue.count or len(issue.fitids)
-        for issue in issues
-        if issue.severity == Severity.WARNING
-    )
-    error_count = sum(
-        issue.count or len(issue.fitids)
-        for issue in issues
-        if issue.severity == Severity.ERROR
-    )
+    # One pass over issues: affected-transaction counts, FITID totals and the
+    # first 10 FITIDs per severity (only those are displayed).
+    severity_counts = {Severity.WARNING: 0, Severity.ERROR: 0}
+    severity_fitid_totals = {Severity.WARNING: 0, Severity.ERROR: 0}
+    severity_fitids: dict[Severity, list[str]] = {Severity.WARNING: [], Severity.ERROR: []}
+    for issue in issues:
+        if issue.severity in severity_counts:
+            severity_counts[issue.severity] += issue.count or len(issue.fitids)
+            severity_fitid_totals[issue.severity] += len(issue.fitids)
+            shown = severity_fitids[issue.severity]
+            if len(shown) < 10:
+                shown.extend(issue.fitids[: 10 - len(shown)])
+    warning_count = severity_counts[Severity.WARNING]
+    error_count = severity_counts[Severity.ERROR]
     ok_count = max(total_transactions - warning_count - error_count, 0)
 
     # Quality indicator — prefer sanity score, fall back to heuristic
@@ -134,6 +148,16 @@ def render_summary(
         quality_detail = f"{quality} (SANITY skipped → downgraded)"
         quality_style = "yellow"
 
+    # The same FITIDs show up in the severity table, the collision panel and
+    # the issue details; format each one once.
+    formatted_fitids: dict[str, str] = {}
+
+    def format_fitid(fitid: str) -> str:
+        text = formatted_fitids.get(fitid)
+        if text is None:
+            text = formatted_fitids[fitid] = _format_fitid(fitid, fitid_lines, fitid_to_json)
+        return text
+
     severity_table = Table(title="Validation Summary", show_lines=True)
     severity_table.add_column("Severity")
     severity_table.add_column("Affected Transactions")
@@ -141,19 +165,13 @@ def render_summary(
 
     severity_table.add_row("OK", str(ok_count), "-")
     for severity in (Severity.WARNING, Severity.ERROR):
-        fitids: list[str] = []
-        count = 0
-        for issue in issues:
-            if issue.severity != severity:
-                continue
-            count += issue.count or len(issue.fitids)
-            fitids.extend(issue.fitids)
-        formatted = [
-            _format_fitid(f, fitid_lines, fitid_to_json) for f in fitids[:10]
-        ]
+        fitids = severity_fitids[severity]
+        fitid_total = severity_fitid_totals[severity]
+        count = severity_counts[severity]
+        formatted = [format_fitid(f) for f in fitids]
         fitid_display = "\n".join(formatted) if formatted else "-"
-        if len(fitids) > 10:
-            fitid_display = f"{fitid_display}\n... (+{len(fitids) - 10} more)"
+        if fitid_total > 10:
+            fitid_display = f"{fitid_display}\n... (+{fitid_total - 10} more)"
         severity_table.add_row(severity.value, str(count), fitid_display)
 
     console.print(severity_table)
@@ -164,10 +182,7 @@ def render_summary(
     if issues:
         for issue in issues:
             if issue.reason.startswith("FITID collisions detected"):
-                formatted_col = [
-                    _format_fitid(f, fitid_lines, fitid_to_json)
-                    for f in issue.fitids[:10]
-                ]
+                formatted_col = [format_fitid(f) for f in issue.fitids[:10]]
                 fitid_display = ", ".join(formatted_col) if formatted_col else "-"
                 if issue.fitids and len(issue.fitids) > 10:
                     fitid_display = (
@@ -190,10 +205,7 @@ def render_summary(
         issues_table.add_column("Count")
         issues_table.add_column("FITIDs")
         for issue in issues:
-            formatted_ids = [
-                _format_fitid(f, fitid_lines, fitid_to_json)
-                for f in issue.fitids[:10]
-            ]
+            formatted_ids = [format_fitid(f) for f in issue.fitids[:10]]
             fitid_display = "\n".join(formatted_ids) if formatted_ids else "-"
             if issue.fitids and len(issue.fitids) > 10:
                 fitid_display = f"{fitid_display}\n... (+{len(issue.fitids) - 10} more)"
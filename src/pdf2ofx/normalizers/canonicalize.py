@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
-from datetime import date, datetime
+from datetime import date
 from decimal import Decimal
 from typing import Any
 
+from pdf2ofx.helpers.decimals import ZERO, to_decimal
+
+
 @dataclass
 class NormalizationResult:
     statement: dict
@@ -24,6 +28,10 @@ def _extract_value(value: Any) -> Any:
     return value
 
 
+# DD/MM/YYYY or YYYY/MM/DD; replaces two strptime calls per non-ISO date.
+_SLASH_DATE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})|(\d{4})/(\d{1,2})/(\d{1,2})")
+
+
 def _parse_date(value: Any) -> str | None:
     if not value:
         return None
@@ -33,21 +41,25 @@ def _parse_date(value: Any) -> str | None:
         try:
             return date.fromisoformat(value).isoformat()
         except ValueError:
-            for fmt in ("%d/%m/%Y", "%Y/%m/%d"):
-                try:
-                    return datetime.strptime(value, fmt).date().isoformat()
-                except ValueError:
-                    continue
+            pass
+        # Non-ISO fallbacks, same as strptime "%d/%m/%Y" then "%Y/%m/%d"
+        match = _SLASH_DATE.fullmatch(value)
+        if match:
+            day, month, year, year2, month2, day2 = match.groups()
+            try:
+                if year is not None:
+                    return date(int(year), int(month), int(day)).isoformat()
+                return date(int(year2), int(month2), int(day2)).isoformat()
+            except ValueError:
+                return None
     return None
 
 
 def _parse_decimal(value: Any) -> Decimal | None:
     if value is None or value == "":
         return None
-    if isinstance(value, Decimal):
-        return value
     try:
-        return Decimal(str(value))
+        return to_decimal(value)
     except Exception:
         return None
 
@@ -112,12 +124,14 @@ def _normalize_schema_a(prediction: dict, account_defaults: dict | None) -> Norm
             "Transactions field is not a list. Expected custom model schema A."
         )
 
+    # Per-row helpers bound to locals: the loop runs once per transaction.
+    extract, parse_date, parse_decimal = _extract_value, _parse_date, _parse_decimal
     transactions: list[dict] = []
     for item in transactions_raw:
-        item = item or {}
-        op_date = _parse_date(_extract_value(item.get("Operation Date")))
-        post_date = _parse_date(_extract_value(item.get("Posting Date")))
-        val_date = _parse_date(_extract_value(item.get("Value Date")))
+        get = (item or {}).get
+        op_date = parse_date(extract(get("Operation Date")))
+        post_date = parse_date(extract(get("Posting Date")))
+        val_date = parse_date(extract(get("Value Date")))
         posted_at = op_date or post_date or val_date
         if op_date:
             posted_at_source = "operation"
@@ -128,20 +142,20 @@ def _normalize_schema_a(prediction: dict, account_defaults: dict | None) -> Norm
         else:
             posted_at_source = None
 
-        amount_signed = _parse_decimal(_extract_value(item.get("Amount Signed")))
-        debit = _parse_decimal(_extract_value(item.get("Debit Amount")))
-        credit = _parse_decimal(_extract_value(item.get("Credit Amount")))
+        amount_signed = parse_decimal(extract(get("Amount Signed")))
+        debit = parse_decimal(extract(get("Debit Amount")))
+        credit = parse_decimal(extract(get("Credit Amount")))
 
         amount = amount_signed
         if amount is None:
-            if debit not in (None, Decimal("0")):
+            if debit not in (None, ZERO):
                 amount = -abs(debit)
-            elif credit not in (None, Decimal("0")):
+            elif credit not in (None, ZERO):
                 amount = abs(credit)
 
-        description = _extract_value(item.get("Description"))
+        description = extract(get("Description"))
         memo = None
-        notes = _extract_value(item.get("Row Confidence Notes"))
+        notes = extract(get("Row Confidence Notes"))
         if notes:
             memo = f"{notes}"
         name = description or "UNKNOWN"
@@ -208,15 +222,18 @@ def _normalize_schema_a_v2(prediction: dict, account_defaults: dict | None) -> N
             "transactions.items field is not a list. Expected V2 custom model schema."
         )
 
+    # Per-row helpers bound to locals: the loop runs once per transaction.
+    extract, parse_date, parse_decimal = _extract_value, _parse_date, _parse_decimal
     transactions: list[dict] = []
     for item in transactions_raw:
         item = item or {}
         # V2 items may have a nested "fields" dict
         fields = item.get("fields", item) if isinstance(item, dict) else item
+        get = fields.get
 
-        op_date = _parse_date(_extract_value(fields.get("operation_date")))
-        post_date = _parse_date(_extract_value(fields.get("posting_date")))
-        val_date = _parse_date(_extract_value(fields.get("value_date")))
+        op_date = parse_date(extract(get("operation_date")))
+        post_date = parse_date(extract(get("posting_date")))
+        val_date = parse_date(extract(get("value_date")))
         posted_at = op_date or post_date or val_date
         if op_date:
             posted_at_source = "operation"
@@ -227,20 +244,20 @@ def _normalize_schema_a_v2(prediction: dict, account_defaults: dict | None) -> N
         else:
             posted_at_source = None
 
-        amount_signed = _parse_decimal(_extract_value(fields.get("amount")))
-        debit = _parse_decimal(_extract_value(fields.get("debit_amount")))
-        credit = _parse_decimal(_extract_value(fields.get("credit_amount")))
+        amount_signed = parse_decimal(extract(get("amount")))
+        debit = parse_decimal(extract(get("debit_amount")))
+        credit = parse_decimal(extract(get("credit_amount")))
 
         amount = amount_signed
         if amount is None:
-            if debit not in (None, Decimal("0")):
+            if debit not in (None, ZERO):
                 amount = -abs(debit)
-            elif credit not in (None, Decimal("0")):
+            elif credit not in (None, ZERO):
                 amount = abs(credit)
 
-        description = _extract_value(fields.get("description"))
+        description = extract(get("description"))
         memo = None
-        notes = _extract_value(fields.get("row_confidence_notes"))
+        notes = extract(get("row_confidence_notes"))
         if notes:
             memo = f"{notes}"
         name = description or "UNKNOWN"
@@ -289,18 +306,30 @@ def _normalize_schema_a_v2(prediction: dict, account_defaults: dict | None) -> N
     return NormalizationResult(statement=statement, warnings=warnings)
 
 
+# Marker keys used to tell the Mindee response schemas apart.
+_SCHEMA_A_KEYS = frozenset({"Transactions", "Bank Name", "Start Date"})
+_SCHEMA_A_V2_KEYS = frozenset({"transactions", "bank_name", "start_date"})
+_MINDEE_DEFAULT_SCHEMA_KEYS = frozenset({"account_number", "list_of_transactions"})
+
+
 def canonicalize_mindee(raw: dict, account_defaults: dict | None = None) -> NormalizationResult:
     prediction = _extract_prediction(raw)
+    if not isinstance(prediction, dict):
+        raise NormalizationError(
+            "Unrecognized Mindee schema. Expected a JSON object of prediction fields."
+        )
+
+    keys = prediction.keys()
 
     # V1 schema A: Title Case field names
-    if any(key in prediction for key in ("Transactions", "Bank Name", "Start Date")):
+    if not keys.isdisjoint(_SCHEMA_A_KEYS):
         return _normalize_schema_a(prediction, account_defaults)
 
     # V2 schema: snake_case field names
-    if any(key in prediction for key in ("transactions", "bank_name", "start_date")):
+    if not keys.isdisjoint(_SCHEMA_A_V2_KEYS):
         return _normalize_schema_a_v2(prediction, account_defaults)
 
-    if any(key in prediction for key in ("account_number", "list_of_transactions")):
+    if not keys.isdisjoint(_MINDEE_DEFAULT_SCHEMA_KEYS):
         raise NormalizationError(
             "Mindee default bank statement schema is not implemented yet."
         )
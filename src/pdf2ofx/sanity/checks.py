@@ -8,6 +8,9 @@ from dataclasses import dataclass, field
 from decimal import Decimal, InvalidOperation
 from typing import Any
 
+from pdf2ofx.helpers.decimals import ZERO, to_decimal
+from pdf2ofx.helpers.reporting import Severity
+
 
 # ---------------------------------------------------------------------------
 # Data model
@@ -39,53 +42,53 @@ class SanityResult:
     forced_accept: bool = False        # True when operator force-accepted on ERROR
 
 
+# Reconciliation thresholds: |delta| <= OK is OK, <= WARN is WARNING, else ERROR.
+_DELTA_OK = Decimal("0.01")
+_DELTA_WARN = Decimal("1.00")
+
+
 # ---------------------------------------------------------------------------
 # Balance extraction from raw Mindee response
 # ---------------------------------------------------------------------------
 
-_START_BALANCE_KEYS = [
+_START_BALANCE_KEYS = (
     "Starting Balance", "starting_balance",
     "Start Balance", "start_balance",
     "Balance Start", "balance_start",
     "Opening Balance", "opening_balance",
-]
+)
 
-_END_BALANCE_KEYS = [
+_END_BALANCE_KEYS = (
     "Ending Balance", "ending_balance",
     "End Balance", "end_balance",
     "Balance End", "balance_end",
     "Closing Balance", "closing_balance",
-]
+)
+
+
+# Where the prediction / fields dict lives, in lookup order: V1 document,
+# V1 inference, V2 result fields.
+_PREDICTION_PATHS = (
+    ("document", "inference", "prediction"),
+    ("inference", "prediction"),
+    ("inference", "result", "fields"),
+)
 
 
 def _get_prediction(raw: dict) -> dict | None:
     """Navigate raw Mindee response to the prediction / fields dict."""
-    try:
-        if "document" in raw:
-            doc = raw.get("document")
-            if isinstance(doc, dict):
-                inf = doc.get("inference")
-                if isinstance(inf, dict):
-                    pred = inf.get("prediction")
-                    if isinstance(pred, dict) and pred:
-                        return pred
-        if "inference" in raw:
-            inf = raw.get("inference")
-            if isinstance(inf, dict):
-                pred = inf.get("prediction")
-                if isinstance(pred, dict) and pred:
-                    return pred
-                result = inf.get("result")
-                if isinstance(result, dict):
-                    fields = result.get("fields")
-                    if isinstance(fields, dict) and fields:
-                        return fields
-    except (AttributeError, TypeError):
+    if not isinstance(raw, dict):
         return None
+    for path in _PREDICTION_PATHS:
+        node: Any = raw
+        for key in path:
+            node = node.get(key) if isinstance(node, dict) else None
+        if isinstance(node, dict) and node:
+            return node
     return raw
 
 
-def _extract_decimal_field(prediction: dict, candidate_keys: list[str]) -> Decimal | None:
+def _extract_decimal_field(prediction: dict, candidate_keys: tuple[str, ...]) -> Decimal | None:
     """Try multiple key names; return first parseable Decimal or None."""
     for key in candidate_keys:
         val: Any = prediction.get(key)
@@ -95,6 +98,8 @@ def _extract_decimal_field(prediction: dict, candidate_keys: list[str]) -> Decim
             val = val["value"]
         if val is None or val == "":
             continue
+        if isinstance(val, Decimal):
+            return val
         try:
             return Decimal(str(val))
         except (InvalidOperation, ValueError, TypeError):
@@ -131,9 +136,10 @@ def compute_reconciliation(
         return None, None, "SKIPPED"
     reconciled_end = starting_balance + net_movement
     delta = reconciled_end - ending_balance
-    if abs(delta) <= Decimal("0.01"):
+    abs_delta = abs(delta)
+    if abs_delta <= _DELTA_OK:
         status = "OK"
-    elif abs(delta) <= Decimal("1.00"):
+    elif abs_delta <= _DELTA_WARN:
         status = "WARNING"
     else:
         status = "ERROR"
@@ -152,29 +158,21 @@ def compute_quality_score(
     low_mindee_confidence: bool = False,
 ) -> tuple[int, str, list[tuple[str, int]]]:
     """Return (score, label, deductions).  Score in [0, 100]."""
-    score = 100
-    deductions: list[tuple[str, int]] = []
-
-    if reconciliation_status == "ERROR":
-        score -= 60
-        deductions.append(("Reconciliation error", -60))
-    if balances_missing:
-        score -= 25
-        deductions.append(("Balances missing", -25))
-    if drop_ratio > 0.10:
-        score -= 15
-        deductions.append((f"High drop rate ({drop_ratio:.0%})", -15))
     warning_deduction = min(warning_count * 10, 30)
-    if warning_deduction > 0:
-        score -= warning_deduction
-        deductions.append(
-            (f"{warning_count} validation warning(s)", -warning_deduction)
-        )
-    if low_mindee_confidence:
-        score -= 15
-        deductions.append(("Low Mindee confidence", -15))
-
-    score = max(score, 0)
+    # (applies, reason template, points); templates are formatted only when applied.
+    table = (
+        (reconciliation_status == "ERROR", "Reconciliation error", -60),
+        (balances_missing, "Balances missing", -25),
+        (drop_ratio > 0.10, "High drop rate ({drop_ratio:.0%})", -15),
+        (warning_deduction > 0, "{warning_count} validation warning(s)", -warning_deduction),
+        (low_mindee_confidence, "Low Mindee confidence", -15),
+    )
+    deductions: list[tuple[str, int]] = [
+        (reason.format(drop_ratio=drop_ratio, warning_count=warning_count), points)
+        for applies, reason, points in table
+        if applies
+    ]
+    score = max(100 + sum(points for _, points in deductions), 0)
 
     if score >= 80:
         label = "GOOD"
@@ -208,20 +206,22 @@ def compute_sanity(
     kept_count = len(transactions)
     dropped_count = extracted_count - kept_count
 
-    total_credits = Decimal("0")
-    total_debits = Decimal("0")
+    # Validated statements already hold Decimal amounts, which to_decimal
+    # returns as-is. Parsing and the credit/debit split share one pass.
+    total_credits = ZERO
+    total_debits = ZERO
     for tx in transactions:
         amount = tx.get("amount")
         if amount is None:
             continue
         try:
-            amt = Decimal(str(amount))
+            amount = to_decimal(amount)
         except (InvalidOperation, ValueError, TypeError):
             continue
-        if amt >= 0:
-            total_credits += amt
+        if amount >= 0:
+            total_credits += amount
         else:
-            total_debits += amt
+            total_debits += amount
     net_movement = total_credits + total_debits
 
     # Try raw Mindee response for any balance not provided explicitly
@@ -239,11 +239,11 @@ def compute_sanity(
     balances_missing = starting_balance is None or ending_balance is None
     drop_ratio = dropped_count / extracted_count if extracted_count > 0 else 0.0
 
-    warning_count = 0
-    if validation_issues:
-        for issue in validation_issues:
-            if hasattr(issue, "severity") and str(issue.severity.value) == "WARNING":
-                warning_count += 1
+    warning_count = sum(
+        1
+        for issue in validation_issues or ()
+        if getattr(issue, "severity", None) is Severity.WARNING
+    )
 
     quality_score, quality_label, deductions = compute_quality_score(
         reconciliation_status=recon_status,
@@ -6,27 +6,30 @@ Decimal-safe; no page info → flat list (no separators).
 from __future__ import annotations
 
 from decimal import Decimal
+from itertools import groupby
+from operator import itemgetter
 from typing import Any, Callable
 
 from InquirerPy.base.control import Choice
 from InquirerPy.separator import Separator
 
+from pdf2ofx.helpers.decimals import ZERO, to_decimal
+
 
 def _to_decimal(amt: Any) -> Decimal:
     if amt is None:
-        return Decimal("0")
-    if isinstance(amt, Decimal):
-        return amt
+        return ZERO
     try:
-        return Decimal(str(amt))
+        return to_decimal(amt)
     except Exception:
-        return Decimal("0")
+        return ZERO
 
 
 def has_any_page(transactions: list[dict], indices: list[int]) -> bool:
     """True if any transaction at the given indices has a valid page."""
+    n_tx = len(transactions)
     for i in indices:
-        if 0 <= i < len(transactions):
+        if 0 <= i < n_tx:
             p = transactions[i].get("page")
             if isinstance(p, int) and p >= 1:
                 return True
@@ -54,60 +57,37 @@ def get_page_groups(
     if not has_any_page(transactions, indices):
         return None
 
-    # Build (index, tx, page_or_none) for each index
-    indexed: list[tuple[int, dict, int | None]] = []
+    # Decorate each index with its sort key, computed once:
+    # (0, page, index) for known pages, (1, 0, index) so unknown sorts last.
+    n_tx = len(transactions)
+    decorated: list[tuple[tuple[int, int, int], int, dict, int | None]] = []
     for i in indices:
-        if 0 <= i < len(transactions):
+        if 0 <= i < n_tx:
             tx = transactions[i]
-            indexed.append((i, tx, _page_label(tx)))
-
-    # Sort: known page ascending, then unknown (None) last
-    def sort_key(item: tuple[int, dict, int | None]) -> tuple[int, int]:
-        page = item[2]
-        if page is None:
-            return (1, item[0])  # unknown after all pages
-        return (0, page * 10000 + item[0])  # by page then index
-
-    indexed.sort(key=sort_key)
-
-    # Group by page label
-    groups: list[tuple[str, list[tuple[int, dict]], Decimal, Decimal]] = []
-    current_label: str | None = None
-    current_list: list[tuple[int, dict]] = []
-    current_credits = Decimal("0")
-    current_debits = Decimal("0")
-
-    for i, tx, page in indexed:
-        amt = _to_decimal(tx.get("amount"))
-        label = f"Page {page}" if page is not None else "Page ?"
-        if label != current_label:
-            if current_list:
-                groups.append((current_label or "Page ?", current_list, current_credits, current_debits))
-            current_label = label
-            current_list = [(i, tx)]
-            current_credits = Decimal("0")
-            current_debits = Decimal("0")
-            if amt >= 0:
-                current_credits += amt
-            else:
-                current_debits += abs(amt)
-        else:
-            current_list.append((i, tx))
-            if amt >= 0:
-                current_credits += amt
-            else:
-                current_debits += abs(amt)
-    if current_list:
-        groups.append((current_label or "Page ?", current_list, current_credits, current_debits))
+            page = _page_label(tx)
+            key = (1, 0, i) if page is None else (0, page, i)
+            decorated.append((key, i, tx, page))
+    decorated.sort(key=itemgetter(0))
+    indexed = [(i, tx, page) for _, i, tx, page in decorated]
 
-    # Add cumulative totals
-    cum_c = Decimal("0")
-    cum_d = Decimal("0")
+    # Group by page (already contiguous after the sort), carrying cumulative totals
     result: list[tuple[str, list[tuple[int, dict]], Decimal, Decimal, Decimal, Decimal]] = []
-    for label, items, pc, pd in groups:
-        cum_c += pc
-        cum_d += pd
-        result.append((label, items, pc, pd, cum_c, cum_d))
+    cum_c = ZERO
+    cum_d = ZERO
+    for page, grp in groupby(indexed, key=itemgetter(2)):
+        items = [(i, tx) for i, tx, _ in grp]
+        page_credits = ZERO
+        page_debits = ZERO
+        for _, tx in items:
+            amt = _to_decimal(tx.get("amount"))
+            if amt >= 0:
+                page_credits += amt
+            else:
+                page_debits -= amt
+        cum_c += page_credits
+        cum_d += page_debits
+        label = f"Page {page}" if page is not None else "Page ?"
+        result.append((label, items, page_credits, page_debits, cum_c, cum_d))
 
     return result
 
@@ -135,9 +115,7 @@ def build_tx_choices_for_checkbox(
     tx_label_fn: Callable[[int, dict], str],
 ) -> list[Choice | Separator]:
     """Build choices for a checkbox list (e.g. Remove some, Invert batch). With page info, insert Separators."""
-    if not has_any_page(transactions, indices):
-        return [Choice(i, name=tx_label_fn(i, transactions[i])) for i in indices]
-
+    # get_page_groups does the has_any_page scan itself (None when no page info).
     groups = get_page_groups(transactions, indices)
     if not groups:
         return [Choice(i, name=tx_label_fn(i, transactions[i])) for i in indices]
@@ -164,10 +142,6 @@ def build_tx_choices_for_select(
     """Build choices for a select list (Edit one transaction). First choice is Back; then optional separators + tx."""
     result: list[Choice | Separator] = [Choice(back_value, name=back_name)]
 
-    if not has_any_page(transactions, indices):
-        result.extend([Choice(i, name=tx_label_fn(i, transactions[i])) for i in indices])
-        return result
-
     groups = get_page_groups(transactions, indices)
     if not groups:
         result.extend([Choice(i, name=tx_label_fn(i, transactions[i])) for i in indices])
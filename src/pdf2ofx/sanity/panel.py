@@ -8,6 +8,7 @@ from decimal import Decimal
 
 from rich.console import Console
 from rich.panel import Panel
+from rich.text import Text
 
 from pdf2ofx.sanity.checks import SanityResult
 
@@ -16,11 +17,14 @@ from pdf2ofx.sanity.checks import SanityResult
 # Formatting helpers
 # ---------------------------------------------------------------------------
 
+_RECON_SYMBOLS = {"OK": "✓", "WARNING": "⚠", "ERROR": "✗"}
+_QUALITY_COLOURS = {"GOOD": "green", "DEGRADED": "yellow", "POOR": "red"}
+
+
 def _fmt_amount(amount: Decimal | None) -> str:
     if amount is None:
         return "—"
-    sign = "+" if amount >= 0 else ""
-    return f"{sign}{amount:,.2f}"
+    return f"{amount:+,.2f}"
 
 
 def _fmt_balance(amount: Decimal | None) -> str:
@@ -30,7 +34,7 @@ def _fmt_balance(amount: Decimal | None) -> str:
 
 
 def _recon_symbol(status: str) -> str:
-    return {"OK": "✓", "WARNING": "⚠", "ERROR": "✗"}.get(status, "—")
+    return _RECON_SYMBOLS.get(status, "—")
 
 
 def _panel_style(result: SanityResult) -> str:
@@ -47,7 +51,7 @@ def _panel_style(result: SanityResult) -> str:
 
 
 def _quality_colour(label: str) -> str:
-    return {"GOOD": "green", "DEGRADED": "yellow", "POOR": "red"}.get(label, "dim")
+    return _QUALITY_COLOURS.get(label, "dim")
 
 
 # ---------------------------------------------------------------------------
@@ -86,27 +90,29 @@ def render_sanity_panel(console: Console, result: SanityResult) -> None:
         lines.append(f"Delta:             {delta_display}   {symbol}")
     else:
         lines.append("Reconciliation:    SKIPPED (balances not available)")
-
     lines.append("")
-    q_colour = _quality_colour(result.quality_label)
-    lines.append(
-        f"Quality: [{q_colour}]{result.quality_label}[/{q_colour}] "
-        f"({result.quality_score}/100)"
-    )
+
+    # Styled spans are appended directly, so Rich never parses markup here
+    # (and brackets in warnings or file names are shown verbatim).
+    body = Text("\n".join(lines))
+    body.append("\nQuality: ")
+    body.append(result.quality_label, style=_quality_colour(result.quality_label))
+    body.append(f" ({result.quality_score}/100)")
 
     if result.deductions:
         for reason, points in result.deductions:
-            lines.append(f"  [dim]{points:+d}  {reason}[/dim]")
+            body.append("\n  ")
+            body.append(f"{points:+d}  {reason}", style="dim")
 
     if result.warnings:
-        lines.append("")
+        body.append("\n")
         for w in result.warnings:
-            lines.append(f"  ⚠ {w}")
+            body.append(f"\n  ⚠ {w}")
 
     console.print(
         Panel.fit(
-            "\n".join(lines),
-            title=f"SANITY: {result.pdf_name}",
+            body,
+            title=Text(f"SANITY: {result.pdf_name}"),
             style=_panel_style(result),
         )
     )
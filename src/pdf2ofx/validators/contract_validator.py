@@ -5,6 +5,7 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import Any
 
+from pdf2ofx.helpers.decimals import ZERO, to_decimal
 from pdf2ofx.helpers.reporting import Issue, Severity
 
 class ValidationError(Exception):
@@ -17,6 +18,10 @@ class ValidationResult:
     issues: list[Issue]
 
 
+# Built once; the transaction loop compares against it for every row.
+_AMOUNT_TOLERANCE = Decimal("0.01")
+
+
 def _parse_date(value: Any) -> date:
     if isinstance(value, date):
         return value
@@ -26,12 +31,19 @@ def _parse_date(value: Any) -> date:
 
 
 def _parse_decimal(value: Any) -> Decimal:
-    if isinstance(value, Decimal):
-        return value
-    return Decimal(str(value))
+    return to_decimal(value)
 
 
-def validate_statement(statement: dict) -> ValidationResult:
+def validate_statement(
+    statement: dict, *, skip_transaction_checks: bool = False
+) -> ValidationResult:
+    """Validate and normalize *statement* in place.
+
+    With ``skip_transaction_checks=True`` (statements that were each validated
+    already, e.g. a concat merge), only the cross-statement work runs: FITID
+    uniqueness, date parsing and period derivation/checks. Amount parsing,
+    debit/credit consistency, trntype and page checks are skipped.
+    """
     issues: dict[tuple[Severity, str], Issue] = {}
 
     def record_issue(
@@ -41,9 +53,9 @@ def validate_statement(statement: dict) -> ValidationResult:
         count: int = 1,
     ) -> None:
         key = (severity, reason)
-        if key not in issues:
-            issues[key] = Issue(severity=severity, reason=reason, fitids=[], count=0)
-        issue = issues[key]
+        issue = issues.get(key)
+        if issue is None:
+            issue = issues[key] = Issue(severity=severity, reason=reason, fitids=[], count=0)
         if fitid:
             issue.fitids.append(fitid)
         issue.count += count
@@ -55,8 +67,26 @@ def validate_statement(statement: dict) -> ValidationResult:
     if not transactions:
         raise ValidationError("transactions must be a non-empty array")
 
+    # Parse the declared period up front so the outside-period check and the
+    # min/max date tracking happen inside the single transaction pass.
+    period = statement.get("period") or {}
+    start = period.get("start_date")
+    end = period.get("end_date")
+    period_bounds: tuple[date, date] | None = None
+    if start and end:
+        try:
+            period_bounds = (_parse_date(start), _parse_date(end))
+        except ValidationError:
+            pass
+
+    # Unpacked so the per-row check is a chained compare against locals;
+    # with no usable period the bounds are None and the check is skipped.
+    period_start, period_end = period_bounds or (None, None)
+
     fitids: set[str] = set()
-    dates: list[date] = []
+    first_date: date | None = None
+    last_date: date | None = None
+    outside_fitids: list[str] = []
     valid_transactions: list[dict] = []
     for tx in transactions:
         posted_at = tx.get("posted_at")
@@ -82,8 +112,16 @@ def validate_statement(statement: dict) -> ValidationResult:
         except ValidationError:
             record_issue(Severity.ERROR, "transaction has invalid posted_at", fitid)
             continue
-        dates.append(parsed_date)
+        if first_date is None or parsed_date < first_date:
+            first_date = parsed_date
+        if last_date is None or parsed_date > last_date:
+            last_date = parsed_date
         tx["posted_at"] = parsed_date.isoformat()
+        if skip_transaction_checks:
+            if period_start is not None and not period_start <= parsed_date <= period_end:
+                outside_fitids.append(fitid)
+            valid_transactions.append(tx)
+            continue
         try:
             tx["amount"] = _parse_decimal(amount)
         except Exception:
@@ -95,26 +133,23 @@ def validate_statement(statement: dict) -> ValidationResult:
         debit_val = _parse_decimal(debit) if debit not in (None, "") else None
         credit_val = _parse_decimal(credit) if credit not in (None, "") else None
 
-        if debit_val not in (None, Decimal("0")) and credit_val not in (
-            None,
-            Decimal("0"),
-        ):
+        if debit_val not in (None, ZERO) and credit_val not in (None, ZERO):
             record_issue(
                 Severity.WARNING,
                 "transaction has both debit and credit amounts",
                 fitid,
             )
-        if debit_val not in (None, Decimal("0")):
+        if debit_val not in (None, ZERO):
             expected = -abs(debit_val)
-            if (tx["amount"] - expected).copy_abs() > Decimal("0.01"):
+            if (tx["amount"] - expected).copy_abs() > _AMOUNT_TOLERANCE:
                 record_issue(
                     Severity.WARNING,
                     "signed amount does not match debit amount",
                     fitid,
                 )
-        if credit_val not in (None, Decimal("0")):
+        if credit_val not in (None, ZERO):
             expected = abs(credit_val)
-            if (tx["amount"] - expected).copy_abs() > Decimal("0.01"):
+            if (tx["amount"] - expected).copy_abs() > _AMOUNT_TOLERANCE:
                 record_issue(
                     Severity.WARNING,
                     "signed amount does not match credit amount",
@@ -133,49 +168,29 @@ def validate_statement(statement: dict) -> ValidationResult:
                 )
                 tx.pop("page", None)
 
+        if period_start is not None and not period_start <= parsed_date <= period_end:
+            outside_fitids.append(fitid)
         valid_transactions.append(tx)
 
-    period = statement.get("period") or {}
-    start = period.get("start_date")
-    end = period.get("end_date")
-    if dates:
-        if not start or not end:
-            derived_start = min(dates)
-            derived_end = max(dates)
-            period["start_date"] = derived_start.isoformat()
-            period["end_date"] = derived_end.isoformat()
-            record_issue(
-                Severity.WARNING, "period missing; derived from transaction dates", None, 0
+    if first_date is not None and last_date is not None:
+        if period_bounds is None:
+            period["start_date"] = first_date.isoformat()
+            period["end_date"] = last_date.isoformat()
+            reason = (
+                "period missing; derived from transaction dates"
+                if not start or not end
+                else "period invalid; derived from transaction dates"
             )
+            record_issue(Severity.WARNING, reason, None, 0)
         else:
-            try:
-                start_date = _parse_date(start)
-                end_date = _parse_date(end)
-            except ValidationError:
-                derived_start = min(dates)
-                derived_end = max(dates)
-                period["start_date"] = derived_start.isoformat()
-                period["end_date"] = derived_end.isoformat()
+            for fitid in outside_fitids:
                 record_issue(
                     Severity.WARNING,
-                    "period invalid; derived from transaction dates",
-                    None,
-                    0,
+                    "transaction outside statement period",
+                    fitid,
                 )
-            else:
-                outside_fitids: list[str] = []
-                for tx_date, tx in zip(dates, valid_transactions):
-                    if tx_date < start_date or tx_date > end_date:
-                        outside_fitids.append(tx.get("fitid"))
-                if outside_fitids:
-                    for fitid in outside_fitids:
-                        record_issue(
-                            Severity.WARNING,
-                            "transaction outside statement period",
-                            fitid,
-                        )
-                period["start_date"] = start_date.isoformat()
-                period["end_date"] = end_date.isoformat()
+            period["start_date"] = period_bounds[0].isoformat()
+            period["end_date"] = period_bounds[1].isoformat()
 
     statement["period"] = period
     statement["transactions"] = valid_transactions
@@ -1 +1,57 @@
 from __future__ import annotations
+
+import copy
+import io
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+
+from pdf2ofx.helpers.fs import read_json
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture(scope="session")
+def canonical_statement_bytes() -> bytes:
+    return (FIXTURES_DIR / "canonical_statement.json").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def _mindee_custom_schema_cached() -> dict:
+    return read_json(FIXTURES_DIR / "mindee_custom_schema.json")
+
+
+@pytest.fixture
+def mindee_custom_schema_raw(_mindee_custom_schema_cached: dict) -> dict:
+    """Parsed mindee_custom_schema.json; a fresh deep copy per test."""
+    return copy.deepcopy(_mindee_custom_schema_cached)
+
+
+@pytest.fixture(scope="module")
+def shared_console() -> Console:
+    """Plain Console writing to a buffer, reused across a test module.
+
+    Fixed width and no colour/highlighting, so Rich neither probes the terminal
+    nor styles output nobody reads.
+    """
+    return Console(
+        file=io.StringIO(),
+        force_terminal=False,
+        width=80,
+        no_color=True,
+        highlight=False,
+    )
+
+
+@pytest.fixture
+def sanity_defaults(shared_console: Console) -> dict:
+    """Keyword arguments common to the interactive _run_sanity_stage tests."""
+    return dict(
+        console=shared_console,
+        pdf_name="stmt.pdf",
+        raw_response=None,
+        validation_issues=[],
+        dev_non_interactive=False,
+        recovery_mode=False,
+    )
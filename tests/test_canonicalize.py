@@ -1,15 +1,15 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from decimal import Decimal
 
-from pdf2ofx.normalizers.canonicalize import canonicalize_mindee
+import pytest
 
+from pdf2ofx.normalizers.canonicalize import NormalizationError, _parse_date, canonicalize_mindee
 
-def test_canonicalize_schema_a(tmp_path: Path) -> None:
-    fixture = Path(__file__).parent / "fixtures" / "mindee_custom_schema.json"
-    raw = json.loads(fixture.read_text(encoding="utf-8"))
+
+def test_canonicalize_schema_a(tmp_path: Path, mindee_custom_schema_raw: dict) -> None:
+    raw = mindee_custom_schema_raw
 
     result = canonicalize_mindee(raw, account_defaults={"account_id": "ACC"})
     statement = result.statement
@@ -155,10 +155,30 @@ def test_canonicalize_v2_page_min_of_candidates() -> None:
     assert tx.get("page") == 1  # min(0, 2) + 1
 
 
-def test_canonicalize_v1_no_page() -> None:
+def test_canonicalize_v1_no_page(mindee_custom_schema_raw: dict) -> None:
     """V1 schema: no page on any tx (regression)."""
-    fixture = Path(__file__).parent / "fixtures" / "mindee_custom_schema.json"
-    raw = json.loads(fixture.read_text(encoding="utf-8"))
+    raw = mindee_custom_schema_raw
     result = canonicalize_mindee(raw, account_defaults={"account_id": "ACC"})
     for tx in result.statement["transactions"]:
         assert "page" not in tx
+
+
+def test_parse_date_iso_and_slash_formats() -> None:
+    assert _parse_date("2024-01-05") == "2024-01-05"
+    assert _parse_date("05/01/2024") == "2024-01-05"
+    assert _parse_date("5/1/2024") == "2024-01-05"
+    assert _parse_date("2024/01/05") == "2024-01-05"
+    assert _parse_date("31/02/2024") is None
+    assert _parse_date("01/01/24") is None
+    assert _parse_date("not a date") is None
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [[], {"inference": {"prediction": [{"Transactions": []}]}}],
+    ids=["top_level_list", "prediction_list"],
+)
+def test_canonicalize_non_object_prediction_raises_normalization_error(raw: object) -> None:
+    """A stray tmp JSON must fail like any unknown schema, not with AttributeError."""
+    with pytest.raises(NormalizationError, match="Unrecognized Mindee schema"):
+        canonicalize_mindee(raw)
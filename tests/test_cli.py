@@ -1,27 +1,41 @@
 from __future__ import annotations
 
-from decimal import Decimal
+import io
+from concurrent.futures import CancelledError
+from decimal import Decimal, InvalidOperation
 from unittest.mock import MagicMock, patch
 
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
+from rich.console import Console
 from typer.testing import CliRunner
 
-from pdf2ofx.cli import RecoveryBackRequested, _run_sanity_stage, app
-
-
-def test_cli_smoke(tmp_path: Path) -> None:
+from pdf2ofx import cli
+from pdf2ofx.cli import (
+    ProcessItem,
+    RecoveryBackRequested,
+    _get_sources_to_open,
+    _InferencePrefetch,
+    _parse_amount_input,
+    _run_sanity_stage,
+    app,
+)
+from pdf2ofx.helpers.reporting import Issue, Severity
+from pdf2ofx.sanity.checks import compute_sanity
+
+
+def test_cli_smoke(tmp_path: Path, canonical_statement_bytes: bytes) -> None:
     base_dir = tmp_path / "pdf2ofx"
     (base_dir / "input").mkdir(parents=True)
     (base_dir / "output").mkdir(parents=True)
     (base_dir / "tmp").mkdir(parents=True)
 
-    fixture = Path(__file__).parent / "fixtures" / "canonical_statement.json"
     canonical_a = base_dir / "statement_a.json"
     canonical_b = base_dir / "statement_b.json"
-    canonical_a.write_text(fixture.read_text(encoding="utf-8"), encoding="utf-8")
-    canonical_b.write_text(fixture.read_text(encoding="utf-8"), encoding="utf-8")
+    canonical_a.write_bytes(canonical_statement_bytes)
+    canonical_b.write_bytes(canonical_statement_bytes)
 
     runner = CliRunner()
     result = runner.invoke(
@@ -45,6 +59,11 @@ def test_cli_smoke(tmp_path: Path) -> None:
     assert (base_dir / "tmp").exists()
 
 
+def _answer(value):
+    """Stand-in for an InquirerPy prompt object whose execute() returns *value*."""
+    return SimpleNamespace(execute=lambda: value)
+
+
 def _minimal_statement() -> dict:
     return {
         "schema_version": "1.0",
@@ -94,10 +113,8 @@ def _statement_one_tx_debit_credit() -> dict:
     }
 
 
-def test_sanity_stage_includes_open_source_pdf_when_source_path_exists(tmp_path: Path) -> None:
+def test_sanity_stage_includes_open_source_pdf_when_source_path_exists(tmp_path: Path, sanity_defaults: dict) -> None:
     """With source_path set and existing, SANITY menu includes Edit and Preview source file (v0.1.4)."""
-    from rich.console import Console
-
     source_pdf = tmp_path / "stmt.pdf"
     source_pdf.write_bytes(b"")
     captured_choices: list[list[tuple[str, str]]] = []
@@ -106,248 +123,156 @@ def test_sanity_stage_includes_open_source_pdf_when_source_path_exists(tmp_path:
         captured_choices.append(choices)
         return "accept"
 
-    with patch("pdf2ofx.cli._prompt_select", side_effect=capture_and_accept):
+    with patch.object(cli, "_prompt_select", side_effect=capture_and_accept):
         _run_sanity_stage(
-            console=Console(),
+            **sanity_defaults,
             statement=_minimal_statement(),
-            pdf_name="stmt.pdf",
             extracted_count=1,
-            raw_response=None,
-            validation_issues=[],
-            dev_non_interactive=False,
             source_path=source_pdf,
-            recovery_mode=False,
         )
     assert len(captured_choices) >= 1
-    choice_labels = [lbl for lbl, _ in captured_choices[0]]
-    choice_values = [v for _, v in captured_choices[0]]
+    choice_labels = "\n".join(lbl for lbl, _ in captured_choices[0])
+    choice_values = {v for _, v in captured_choices[0]}
     assert "edit" in choice_values
-    assert any("Preview source file" in lbl for lbl in choice_labels)
+    assert "Preview source file" in choice_labels
     assert "open" in choice_values
 
 
-def test_sanity_stage_auto_opens_pdf_on_edit_balances(tmp_path: Path) -> None:
+def test_sanity_stage_auto_opens_pdf_on_edit_balances(tmp_path: Path, sanity_defaults: dict) -> None:
     """When user chooses Edit then Edit balances and source_path exists, open_path_in_default_app is called (v0.1.4)."""
-    from unittest.mock import MagicMock
-
-    from rich.console import Console
-
     source_pdf = tmp_path / "stmt.pdf"
     source_pdf.write_bytes(b"")
 
     # L1 → Edit → edit_bal → balance edit → return to L2 → back → accept
-    with patch("pdf2ofx.cli._prompt_select", side_effect=["edit", "edit_bal", "edit", "back", "accept"]), patch(
-        "pdf2ofx.cli._prompt_text", return_value=""
-    ), patch("pdf2ofx.cli.open_path_in_default_app", MagicMock()) as mock_open:
+    with patch.object(cli, "_prompt_select", side_effect=["edit", "edit_bal", "edit", "back", "accept"]), patch.object(
+        cli, "_prompt_text", return_value=""
+    ), patch.object(cli, "open_path_in_default_app", MagicMock()) as mock_open:
         _run_sanity_stage(
-            console=Console(),
+            **sanity_defaults,
             statement=_minimal_statement(),
-            pdf_name="stmt.pdf",
             extracted_count=1,
-            raw_response=None,
-            validation_issues=[],
-            dev_non_interactive=False,
             source_path=source_pdf,
-            recovery_mode=False,
         )
         mock_open.assert_called_once_with(source_pdf)
 
 
-def test_sanity_stage_edit_balances_back_returns_to_menu(tmp_path: Path) -> None:
+def test_sanity_stage_edit_balances_back_returns_to_menu(tmp_path: Path, sanity_defaults: dict) -> None:
     """Edit → Edit balances → ← Back returns to Edit submenu (L2); second Back to L1; then Accept (P0 UX)."""
-    from rich.console import Console
-
     # L1 → Edit → L2 → Edit balances → Back (L2a→L2) → Back (L2→L1) → Accept
-    with patch("pdf2ofx.cli._prompt_select", side_effect=["edit", "edit_bal", "back", "back", "accept"]):
+    with patch.object(cli, "_prompt_select", side_effect=["edit", "edit_bal", "back", "back", "accept"]):
         result = _run_sanity_stage(
-            console=Console(),
+            **sanity_defaults,
             statement=_minimal_statement(),
-            pdf_name="stmt.pdf",
             extracted_count=1,
-            raw_response=None,
-            validation_issues=[],
-            dev_non_interactive=False,
             source_path=None,
-            recovery_mode=False,
         )
     assert result is not None
 
 
-def test_sanity_stage_edit_tx_back_returns_to_menu(tmp_path: Path) -> None:
+def test_sanity_stage_edit_tx_back_returns_to_menu(tmp_path: Path, sanity_defaults: dict) -> None:
     """Edit → Edit transactions → ← Back returns to Edit submenu (L2); second Back to L1; then Accept (P0 UX)."""
-    from rich.console import Console
-
     # L1 → Edit → L2 → edit_tx → L2b Back (→L2) → Back (→L1) → Accept
-    with patch("pdf2ofx.cli._prompt_select", side_effect=["edit", "edit_tx", "back", "back", "accept"]):
+    with patch.object(cli, "_prompt_select", side_effect=["edit", "edit_tx", "back", "back", "accept"]):
         result = _run_sanity_stage(
-            console=Console(),
+            **sanity_defaults,
             statement=_minimal_statement(),
-            pdf_name="stmt.pdf",
             extracted_count=1,
-            raw_response=None,
-            validation_issues=[],
-            dev_non_interactive=False,
             source_path=None,
-            recovery_mode=False,
         )
     assert result is not None
 
 
-def test_sanity_triage_valid_then_edit_shows_only_non_valid(tmp_path: Path) -> None:
-    """Mark some transactions valid via triage; Edit transactions shows only non-valid (v0.1.3)."""
-    from rich.console import Console
-
+@pytest.mark.parametrize(
+    ("prompt_seq", "checkbox_returns", "expected_tx_values"),
+    [
+        pytest.param(
+            # L1 → Edit → triage → Validate [0] → confirm → L2 → edit_tx → edit_one (inquirer back) → back → back → accept
+            ["edit", "triage", "triage_validate", "edit_tx", "edit_one", "back", "back", "accept"],
+            [[0]],
+            {1, 2},
+            id="valid_then_edit_shows_only_non_valid",
+        ),
+        pytest.param(
+            # L1 → Edit → triage → Flag [0,2] → confirm → L2 → edit_tx → edit_one (inquirer back) → back → back → accept
+            ["edit", "triage", "triage_flag", "edit_tx", "edit_one", "back", "back", "accept"],
+            [[0, 2]],
+            {0, 2},
+            id="flagged_then_edit_shows_only_flagged",
+        ),
+        pytest.param(
+            # L1 → Edit → triage Validate [0,1] → L2 → triage Flag [1,2] → L2 → edit_tx → edit_one → back → back → accept
+            [
+                "edit", "triage", "triage_validate",
+                "triage", "triage_flag",
+                "edit_tx", "edit_one",
+                "back", "back", "accept",
+            ],
+            [[0, 1], [1, 2]],
+            {1, 2},
+            id="flag_priority_over_valid",
+        ),
+    ],
+)
+def test_sanity_triage_filters_edit_list(
+    sanity_defaults: dict,
+    prompt_seq: list[str],
+    checkbox_returns: list[list[int]],
+    expected_tx_values: set[int],
+) -> None:
+    """Edit transactions lists only non-valid tx after Validate, only flagged tx once any are flagged (v0.1.3)."""
     captured_select_choices: list[list] = []
 
     def mock_select(message=None, choices=None, **kwargs):
         captured_select_choices.append(choices)
-        result = MagicMock()
-        result.execute.return_value = "__back__"
-        return result
-
-    # L1 → Edit → triage → Validate [0] → confirm → stay at L2 → edit_tx → edit_one (inquirer back) → back (L2b→L2) → back (L2→L1) → accept
-    with patch("pdf2ofx.cli._prompt_select", side_effect=[
-        "edit", "triage", "triage_validate",
-        "edit_tx", "edit_one",
-        "back", "back", "accept",
-    ]), patch("pdf2ofx.cli.inquirer.checkbox", return_value=MagicMock(execute=MagicMock(return_value=[0]))), patch(
-        "pdf2ofx.cli._prompt_confirm", return_value=True
-    ), patch("pdf2ofx.cli.inquirer.select", side_effect=mock_select):
+        return _answer("__back__")
+
+    with patch.multiple(
+        cli,
+        _prompt_select=MagicMock(side_effect=prompt_seq),
+        _prompt_confirm=MagicMock(return_value=True),
+    ), patch.object(cli.inquirer, "checkbox", side_effect=[
+        _answer(ret) for ret in checkbox_returns
+    ]), patch.object(cli.inquirer, "select", side_effect=mock_select):
         result = _run_sanity_stage(
-            console=Console(),
+            **sanity_defaults,
             statement=_statement_with_three_tx(),
-            pdf_name="stmt.pdf",
             extracted_count=3,
-            raw_response=None,
-            validation_issues=[],
-            dev_non_interactive=False,
             source_path=None,
-            recovery_mode=False,
         )
     assert result is not None
-    # Edit-one select was called with choices: Back + filtered indices (only 1, 2)
     assert len(captured_select_choices) >= 1
-    choices = captured_select_choices[-1]
-    values = [getattr(c, "value", c) for c in choices]
+    values = [getattr(c, "value", c) for c in captured_select_choices[-1]]
     tx_values = [v for v in values if v != "__back__"]
-    assert set(tx_values) == {1, 2}
-
+    assert set(tx_values) == expected_tx_values
 
-def test_sanity_triage_flagged_then_edit_shows_only_flagged(tmp_path: Path) -> None:
-    """Mark some transactions flagged via triage; Edit transactions shows only flagged (v0.1.3)."""
-    from rich.console import Console
-
-    captured_select_choices: list[list] = []
-
-    def mock_select(message=None, choices=None, **kwargs):
-        captured_select_choices.append(choices)
-        result = MagicMock()
-        result.execute.return_value = "__back__"
-        return result
-
-    # L1 → Edit → triage → Flag [0,2] → confirm → stay at L2 → edit_tx → edit_one (inquirer back) → back → back → accept
-    with patch("pdf2ofx.cli._prompt_select", side_effect=[
-        "edit", "triage", "triage_flag",
-        "edit_tx", "edit_one",
-        "back", "back", "accept",
-    ]), patch("pdf2ofx.cli.inquirer.checkbox", return_value=MagicMock(execute=MagicMock(return_value=[0, 2]))), patch(
-        "pdf2ofx.cli._prompt_confirm", return_value=True
-    ), patch("pdf2ofx.cli.inquirer.select", side_effect=mock_select):
-        result = _run_sanity_stage(
-            console=Console(),
-            statement=_statement_with_three_tx(),
-            pdf_name="stmt.pdf",
-            extracted_count=3,
-            raw_response=None,
-            validation_issues=[],
-            dev_non_interactive=False,
-            source_path=None,
-            recovery_mode=False,
-        )
-    assert result is not None
-    choices = captured_select_choices[-1]
-    values = [getattr(c, "value", c) for c in choices]
-    tx_values = [v for v in values if v != "__back__"]
-    assert set(tx_values) == {0, 2}
 
-
-def test_sanity_triage_flag_priority_over_valid(tmp_path: Path) -> None:
-    """When both valid and flagged exist, Edit transactions shows only flagged (v0.1.3)."""
-    from rich.console import Console
-
-    captured_select_choices: list[list] = []
-
-    def mock_select(message=None, choices=None, **kwargs):
-        captured_select_choices.append(choices)
-        result = MagicMock()
-        result.execute.return_value = "__back__"
-        return result
-
-    # L1 → Edit → triage Validate [0,1] → L2 → triage Flag [1,2] → L2 → edit_tx → edit_one (inquirer back) → back → back → accept
-    with patch("pdf2ofx.cli._prompt_select", side_effect=[
-        "edit", "triage", "triage_validate",
-        "triage", "triage_flag",
-        "edit_tx", "edit_one",
-        "back", "back", "accept",
-    ]), patch(
-        "pdf2ofx.cli.inquirer.checkbox",
-        side_effect=[
-            MagicMock(execute=MagicMock(return_value=[0, 1])),  # validate
-            MagicMock(execute=MagicMock(return_value=[1, 2])),  # flag
-        ],
-    ), patch("pdf2ofx.cli._prompt_confirm", return_value=True), patch(
-        "pdf2ofx.cli.inquirer.select", side_effect=mock_select
-    ):
-        result = _run_sanity_stage(
-            console=Console(),
-            statement=_statement_with_three_tx(),
-            pdf_name="stmt.pdf",
-            extracted_count=3,
-            raw_response=None,
-            validation_issues=[],
-            dev_non_interactive=False,
-            source_path=None,
-            recovery_mode=False,
-        )
-    assert result is not None
-    choices = captured_select_choices[-1]
-    values = [getattr(c, "value", c) for c in choices]
-    tx_values = [v for v in values if v != "__back__"]
-    assert set(tx_values) == {1, 2}
-
-
-def test_sanity_triage_all_valid_then_edit_shows_empty_message(tmp_path: Path) -> None:
+def test_sanity_triage_all_valid_then_edit_shows_empty_message(tmp_path: Path, sanity_defaults: dict) -> None:
     """When all transactions are validated, Edit transactions shows empty message and returns to menu (v0.1.3)."""
-    mock_console = MagicMock()
+    # Own buffer (not the shared console) so only this run's output is inspected.
+    console = Console(file=io.StringIO(), width=200, no_color=True, highlight=False)
 
     # L1 → Edit → triage Validate [0,1,2] → confirm → L2 → edit_tx (empty filter, stay L2) → back (L2→L1) → accept
-    with patch("pdf2ofx.cli._prompt_select", side_effect=[
-        "edit", "triage", "triage_validate",
-        "edit_tx",
-        "back", "accept",
-    ]), patch("pdf2ofx.cli.inquirer.checkbox", return_value=MagicMock(execute=MagicMock(return_value=[0, 1, 2]))), patch(
-        "pdf2ofx.cli._prompt_confirm", return_value=True
-    ):
+    with patch.multiple(
+        cli,
+        _prompt_select=MagicMock(side_effect=[
+            "edit", "triage", "triage_validate",
+            "edit_tx",
+            "back", "accept",
+        ]),
+        _prompt_confirm=MagicMock(return_value=True),
+    ), patch.object(cli.inquirer, "checkbox", return_value=_answer([0, 1, 2])):
         result = _run_sanity_stage(
-            console=mock_console,
+            **{**sanity_defaults, "console": console},
             statement=_statement_with_three_tx(),
-            pdf_name="stmt.pdf",
             extracted_count=3,
-            raw_response=None,
-            validation_issues=[],
-            dev_non_interactive=False,
             source_path=None,
-            recovery_mode=False,
         )
     assert result is not None
-    messages = [str(c[0][0]) for c in mock_console.print.call_args_list if c[0]]
-    assert any("No transactions match current triage filter" in m for m in messages)
+    assert "No transactions match current triage filter" in console.file.getvalue()
 
 
-def test_sanity_hierarchical_menu_main_and_edit_submenu(tmp_path: Path) -> None:
+def test_sanity_hierarchical_menu_main_and_edit_submenu(tmp_path: Path, sanity_defaults: dict) -> None:
     """Main menu has Accept, Edit, Preview source file, Skip; Edit submenu has Edit balances, Edit transactions, Transaction triage, Back (v0.1.4)."""
-    from rich.console import Console
-
     source_pdf = tmp_path / "stmt.pdf"
     source_pdf.write_bytes(b"")
     captured: list[tuple[str, list[tuple[str, str]]]] = []
@@ -357,88 +282,70 @@ def test_sanity_hierarchical_menu_main_and_edit_submenu(tmp_path: Path) -> None:
         captured.append((message, list(choices)))
         return next(sequence)
 
-    with patch("pdf2ofx.cli._prompt_select", side_effect=capture_and_go):
+    with patch.object(cli, "_prompt_select", side_effect=capture_and_go):
         _run_sanity_stage(
-            console=Console(),
+            **sanity_defaults,
             statement=_minimal_statement(),
-            pdf_name="stmt.pdf",
             extracted_count=1,
-            raw_response=None,
-            validation_issues=[],
-            dev_non_interactive=False,
             source_path=source_pdf,
-            recovery_mode=False,
         )
+    assert next(sequence, None) is None  # every scripted answer was consumed
     main_choices = next((c for msg, c in captured if "Sanity check" in msg), None)
     assert main_choices is not None
-    labels_main = [lbl for lbl, _ in main_choices]
-    values_main = [v for _, v in main_choices]
-    assert any("Accept" in lbl for lbl in labels_main)
+    labels_main = "\n".join(lbl for lbl, _ in main_choices)
+    values_main = {v for _, v in main_choices}
+    assert "Accept" in labels_main
     assert "edit" in values_main
-    assert any("Preview source file" in lbl for lbl in labels_main)
-    assert any("Skip" in lbl for lbl in labels_main)
+    assert "Preview source file" in labels_main
+    assert "Skip" in labels_main
     edit_choices = next((c for msg, c in captured if msg.strip() == "Edit:"), None)
     assert edit_choices is not None
-    values_edit = [v for _, v in edit_choices]
+    values_edit = {v for _, v in edit_choices}
     assert "edit_bal" in values_edit
     assert "edit_tx" in values_edit
     assert "triage" in values_edit
     assert "back" in values_edit
 
 
-def test_sanity_invert_sign_negates_amount(tmp_path: Path) -> None:
+def test_sanity_invert_sign_negates_amount(tmp_path: Path, sanity_defaults: dict) -> None:
     """Edit → Edit transactions → select tx → Invert sign: amount becomes -100 (v0.1.4)."""
-    from rich.console import Console
-
     stmt = _statement_one_tx_amount_100()
     # L1 → Edit → edit_tx → edit_one → select 0 → invert_sign → back at L3 → inquirer back → L2b back → L2 back → accept
-    with patch("pdf2ofx.cli._prompt_select", side_effect=[
+    with patch.object(cli, "_prompt_select", side_effect=[
         "edit", "edit_tx", "edit_one",
         "invert_sign",
         "back", "back", "accept",
-    ]), patch("pdf2ofx.cli.inquirer.select", side_effect=[
-        MagicMock(execute=MagicMock(return_value=0)),
-        MagicMock(execute=MagicMock(return_value="__back__")),
+    ]), patch.object(cli.inquirer, "select", side_effect=[
+        _answer(0),
+        _answer("__back__"),
     ]):
         result = _run_sanity_stage(
-            console=Console(),
+            **sanity_defaults,
             statement=stmt,
-            pdf_name="stmt.pdf",
             extracted_count=1,
-            raw_response=None,
-            validation_issues=[],
-            dev_non_interactive=False,
             source_path=None,
-            recovery_mode=False,
         )
     assert result is not None
     assert stmt["transactions"][0]["amount"] == Decimal("-100.00")
     assert stmt["transactions"][0]["trntype"] == "DEBIT"
 
 
-def test_sanity_invert_sign_swaps_debit_credit(tmp_path: Path) -> None:
+def test_sanity_invert_sign_swaps_debit_credit(tmp_path: Path, sanity_defaults: dict) -> None:
     """Invert sign swaps debit/credit and keeps Decimal (v0.1.4)."""
-    from rich.console import Console
-
     stmt = _statement_one_tx_debit_credit()
-    with patch("pdf2ofx.cli._prompt_select", side_effect=[
+    with patch.object(cli, "_prompt_select", side_effect=[
         "edit", "edit_tx", "edit_one",
         "invert_sign",
         "back", "back", "accept",
-    ]), patch("pdf2ofx.cli.inquirer.select", side_effect=[
-        MagicMock(execute=MagicMock(return_value=0)),
-        MagicMock(execute=MagicMock(return_value="__back__")),
+    ]), patch.object(cli.inquirer, "select", side_effect=[
+        _answer(0),
+        _answer("__back__"),
     ]):
         result = _run_sanity_stage(
-            console=Console(),
+            **sanity_defaults,
             statement=stmt,
-            pdf_name="stmt.pdf",
             extracted_count=1,
-            raw_response=None,
-            validation_issues=[],
-            dev_non_interactive=False,
             source_path=None,
-            recovery_mode=False,
         )
     assert result is not None
     tx = stmt["transactions"][0]
@@ -449,38 +356,35 @@ def test_sanity_invert_sign_swaps_debit_credit(tmp_path: Path) -> None:
     assert not isinstance(tx["amount"], float)
 
 
-def test_sanity_triage_and_invert_sign_filter_unchanged(tmp_path: Path) -> None:
+def test_sanity_triage_and_invert_sign_filter_unchanged(tmp_path: Path, sanity_defaults: dict) -> None:
     """Flag one tx, edit → edit_tx, select it, invert sign; triage filter still shows only that tx (v0.1.4)."""
-    from rich.console import Console
-
     captured_select_choices: list[list] = []
 
     def mock_select(message=None, choices=None, **kwargs):
         captured_select_choices.append(choices)
         # First call: transaction list (filtered to index 0) → select 0. Second: after invert we're back at L3 → back
         if len(captured_select_choices) == 1:
-            return MagicMock(execute=MagicMock(return_value=0))
-        return MagicMock(execute=MagicMock(return_value="__back__"))
+            return _answer(0)
+        return _answer("__back__")
 
     # L1 → Edit → triage Flag [0] → L2 → edit_tx → edit_one → select 0 → invert_sign (return to L3) → back (L3→L2b) → back (L2b→L2) → back (L2→L1) → accept
-    with patch("pdf2ofx.cli._prompt_select", side_effect=[
-        "edit", "triage", "triage_flag",
-        "edit_tx", "edit_one",
-        "invert_sign",
-        "back", "back", "accept",
-    ]), patch("pdf2ofx.cli.inquirer.checkbox", return_value=MagicMock(execute=MagicMock(return_value=[0]))), patch(
-        "pdf2ofx.cli._prompt_confirm", return_value=True
-    ), patch("pdf2ofx.cli.inquirer.select", side_effect=mock_select):
+    with patch.multiple(
+        cli,
+        _prompt_select=MagicMock(side_effect=[
+            "edit", "triage", "triage_flag",
+            "edit_tx", "edit_one",
+            "invert_sign",
+            "back", "back", "accept",
+        ]),
+        _prompt_confirm=MagicMock(return_value=True),
+    ), patch.object(
+        cli.inquirer, "checkbox", return_value=_answer([0])
+    ), patch.object(cli.inquirer, "select", side_effect=mock_select):
         result = _run_sanity_stage(
-            console=Console(),
+            **sanity_defaults,
             statement=_statement_with_three_tx(),
-            pdf_name="stmt.pdf",
             extracted_count=3,
-            raw_response=None,
-            validation_issues=[],
-            dev_non_interactive=False,
             source_path=None,
-            recovery_mode=False,
         )
     assert result is not None
     assert len(captured_select_choices) >= 2
@@ -494,28 +398,23 @@ def test_sanity_triage_and_invert_sign_filter_unchanged(tmp_path: Path) -> None:
 # --- Batch invert sign (v0.1.5) ---
 
 
-def test_sanity_batch_invert_negates_multiple_tx(tmp_path: Path) -> None:
+def test_sanity_batch_invert_negates_multiple_tx(tmp_path: Path, sanity_defaults: dict) -> None:
     """Edit → Invert transaction sign(s) → select multiple tx → confirm: amounts negated (v0.1.5)."""
-    from rich.console import Console
-
     stmt = _statement_with_three_tx()
     # L1 → Edit → invert_sign_batch → checkbox [0, 2] → confirm → L2 → back → accept
-    with patch("pdf2ofx.cli._prompt_select", side_effect=[
-        "edit", "invert_sign_batch",
-        "back", "accept",
-    ]), patch("pdf2ofx.cli.inquirer.checkbox", return_value=MagicMock(execute=MagicMock(return_value=[0, 2]))), patch(
-        "pdf2ofx.cli._prompt_confirm", return_value=True
-    ):
+    with patch.multiple(
+        cli,
+        _prompt_select=MagicMock(side_effect=[
+            "edit", "invert_sign_batch",
+            "back", "accept",
+        ]),
+        _prompt_confirm=MagicMock(return_value=True),
+    ), patch.object(cli.inquirer, "checkbox", return_value=_answer([0, 2])):
         result = _run_sanity_stage(
-            console=Console(),
+            **sanity_defaults,
             statement=stmt,
-            pdf_name="stmt.pdf",
             extracted_count=3,
-            raw_response=None,
-            validation_issues=[],
-            dev_non_interactive=False,
             source_path=None,
-            recovery_mode=False,
         )
     assert result is not None
     # Tx0 was -10 DEBIT → +10 CREDIT; Tx2 was -25 DEBIT → +25 CREDIT
@@ -527,27 +426,48 @@ def test_sanity_batch_invert_negates_multiple_tx(tmp_path: Path) -> None:
     assert Decimal(str(stmt["transactions"][1]["amount"])) == Decimal("50.00")
 
 
-def test_sanity_batch_invert_swaps_debit_credit(tmp_path: Path) -> None:
-    """Batch invert swaps debit/credit fields correctly (v0.1.5)."""
-    from rich.console import Console
+def test_sanity_recompute_keeps_raw_balances_extracted_once(sanity_defaults: dict) -> None:
+    """Balances are read from the raw response once; recomputes after edits reuse them."""
+    raw = {"inference": {"result": {"fields": {
+        "starting_balance": {"value": "100.00"},
+        "ending_balance": {"value": "15.00"},
+    }}}}
+    with patch.multiple(
+        cli,
+        _prompt_select=MagicMock(side_effect=[
+            "edit", "invert_sign_batch",
+            "back", "accept",
+        ]),
+        _prompt_confirm=MagicMock(return_value=True),
+        extract_balances=MagicMock(wraps=cli.extract_balances),
+    ), patch.object(cli.inquirer, "checkbox", return_value=_answer([0])):
+        result = _run_sanity_stage(
+            **{**sanity_defaults, "raw_response": raw},
+            statement=_statement_with_three_tx(),
+            extracted_count=3,
+            source_path=None,
+        )
+        assert cli.extract_balances.call_count == 1
+    assert result.starting_balance == Decimal("100.00")
+    assert result.ending_balance == Decimal("15.00")
 
+
+def test_sanity_batch_invert_swaps_debit_credit(tmp_path: Path, sanity_defaults: dict) -> None:
+    """Batch invert swaps debit/credit fields correctly (v0.1.5)."""
     stmt = _statement_one_tx_debit_credit()
-    with patch("pdf2ofx.cli._prompt_select", side_effect=[
-        "edit", "invert_sign_batch",
-        "back", "accept",
-    ]), patch("pdf2ofx.cli.inquirer.checkbox", return_value=MagicMock(execute=MagicMock(return_value=[0]))), patch(
-        "pdf2ofx.cli._prompt_confirm", return_value=True
-    ):
+    with patch.multiple(
+        cli,
+        _prompt_select=MagicMock(side_effect=[
+            "edit", "invert_sign_batch",
+            "back", "accept",
+        ]),
+        _prompt_confirm=MagicMock(return_value=True),
+    ), patch.object(cli.inquirer, "checkbox", return_value=_answer([0])):
         result = _run_sanity_stage(
-            console=Console(),
+            **sanity_defaults,
             statement=stmt,
-            pdf_name="stmt.pdf",
             extracted_count=1,
-            raw_response=None,
-            validation_issues=[],
-            dev_non_interactive=False,
             source_path=None,
-            recovery_mode=False,
         )
     assert result is not None
     tx = stmt["transactions"][0]
@@ -557,37 +477,32 @@ def test_sanity_batch_invert_swaps_debit_credit(tmp_path: Path) -> None:
     assert tx["credit"] == "10.00"
 
 
-def test_sanity_batch_invert_respects_triage_filter(tmp_path: Path) -> None:
+def test_sanity_batch_invert_respects_triage_filter(tmp_path: Path, sanity_defaults: dict) -> None:
     """Batch invert shows only triage-filtered transactions (e.g. flagged only) (v0.1.5)."""
-    from rich.console import Console
-
     captured_choices: list[list] = []
 
     def capture_checkbox(message=None, choices=None, **kwargs):
         captured_choices.append(choices)
         # First call: triage flag → return [0, 2]. Second: batch invert → return [] (no mutate).
         if len(captured_choices) == 1:
-            return MagicMock(execute=MagicMock(return_value=[0, 2]))
-        return MagicMock(execute=MagicMock(return_value=[]))
+            return _answer([0, 2])
+        return _answer([])
 
     # L1 → Edit → triage Flag [0, 2] → L2 → invert_sign_batch (checkbox shows only 0, 2)
-    with patch("pdf2ofx.cli._prompt_select", side_effect=[
-        "edit", "triage", "triage_flag",
-        "invert_sign_batch",
-        "back", "accept",
-    ]), patch("pdf2ofx.cli.inquirer.checkbox", side_effect=capture_checkbox), patch(
-        "pdf2ofx.cli._prompt_confirm", return_value=True
-    ):
+    with patch.multiple(
+        cli,
+        _prompt_select=MagicMock(side_effect=[
+            "edit", "triage", "triage_flag",
+            "invert_sign_batch",
+            "back", "accept",
+        ]),
+        _prompt_confirm=MagicMock(return_value=True),
+    ), patch.object(cli.inquirer, "checkbox", side_effect=capture_checkbox):
         result = _run_sanity_stage(
-            console=Console(),
+            **sanity_defaults,
             statement=_statement_with_three_tx(),
-            pdf_name="stmt.pdf",
             extracted_count=3,
-            raw_response=None,
-            validation_issues=[],
-            dev_non_interactive=False,
             source_path=None,
-            recovery_mode=False,
         )
     assert result is not None
     # Second checkbox call is batch invert (first was triage flag)
@@ -597,10 +512,8 @@ def test_sanity_batch_invert_respects_triage_filter(tmp_path: Path) -> None:
     assert set(values) == {0, 2}
 
 
-def test_sanity_batch_invert_returns_to_l2(tmp_path: Path) -> None:
+def test_sanity_batch_invert_returns_to_l2(tmp_path: Path, sanity_defaults: dict) -> None:
     """After batch invert, next prompt is L2 (Edit submenu), not L1 (v0.1.5)."""
-    from rich.console import Console
-
     edit_prompts: list[str] = []
 
     def capture_edit(msg: str, choices: list[tuple[str, str]], default: str) -> str:
@@ -613,20 +526,18 @@ def test_sanity_batch_invert_returns_to_l2(tmp_path: Path) -> None:
         "back", "accept",
     ])
 
-    with patch("pdf2ofx.cli._prompt_select", side_effect=capture_edit), patch(
-        "pdf2ofx.cli.inquirer.checkbox", return_value=MagicMock(execute=MagicMock(return_value=[0]))
-    ), patch("pdf2ofx.cli._prompt_confirm", return_value=True):
+    with patch.multiple(
+        cli,
+        _prompt_select=MagicMock(side_effect=capture_edit),
+        _prompt_confirm=MagicMock(return_value=True),
+    ), patch.object(cli.inquirer, "checkbox", return_value=_answer([0])):
         _run_sanity_stage(
-            console=Console(),
+            **sanity_defaults,
             statement=_statement_with_three_tx(),
-            pdf_name="stmt.pdf",
             extracted_count=3,
-            raw_response=None,
-            validation_issues=[],
-            dev_non_interactive=False,
             source_path=None,
-            recovery_mode=False,
         )
+    assert next(_batch_return_seq, None) is None  # every scripted answer was consumed
     # First Edit: when entering L2; second Edit: after batch invert (return to L2)
     assert len(edit_prompts) >= 2
 
@@ -634,93 +545,59 @@ def test_sanity_batch_invert_returns_to_l2(tmp_path: Path) -> None:
 # --- Navigation tests (hierarchical Back + return points) ---
 
 
-def test_sanity_back_from_l4_returns_to_l3(tmp_path: Path) -> None:
-    """Back from per-tx menu (L4) returns to transaction list (L3); then Back L3→L2b, L2b→L2, L2→L1, Accept."""
-    from rich.console import Console
-
+@pytest.mark.parametrize(
+    ("prompt_seq", "select_answers"),
+    [
+        pytest.param(
+            # L1 → Edit → edit_tx → edit_one → select tx 0 → L4 Back (→L3) → L3 Back (→L2b) → L2b Back → L2 Back → Accept
+            ["edit", "edit_tx", "edit_one", "back", "back", "back", "accept"],
+            [0, "__back__"],
+            id="back_from_l4_returns_to_l3",
+        ),
+        pytest.param(
+            # L1 → Edit → edit_tx → edit_one → L3 Back (→L2b) → L2b Back → L2 Back → Accept
+            ["edit", "edit_tx", "edit_one", "back", "back", "accept"],
+            ["__back__"],
+            id="back_from_l3_returns_to_l2b",
+        ),
+        pytest.param(
+            # L1 → Edit → edit_tx → L2b Back (→L2) → L2 Back (→L1) → Accept
+            ["edit", "edit_tx", "back", "back", "accept"],
+            [],
+            id="back_from_l2b_returns_to_l2",
+        ),
+    ],
+)
+def test_sanity_back_navigation(
+    sanity_defaults: dict, prompt_seq: list[str], select_answers: list
+) -> None:
+    """Each Back climbs exactly one level: L4→L3→L2b→L2→L1, then Accept."""
     captured: list[str] = []
+    answers = iter(prompt_seq)
 
     def capture_prompts(msg: str, choices: list[tuple[str, str]], default: str) -> str:
         captured.append(msg)
-        return next(_back_l4_sequence)
-
-    _back_l4_sequence = iter([
-        "edit", "edit_tx", "edit_one",
-        "back",   # L4 Back → L3 (inquirer next)
-        "back", "back", "accept",  # L2b Back, L2 Back, L1 Accept
-    ])
+        return next(answers)
 
-    with patch("pdf2ofx.cli._prompt_select", side_effect=capture_prompts), patch(
-        "pdf2ofx.cli.inquirer.select",
-        side_effect=[
-            MagicMock(execute=MagicMock(return_value=0)),   # select tx (L3)
-            MagicMock(execute=MagicMock(return_value="__back__")),  # L3 Back → L2b
-        ],
+    with patch.object(cli, "_prompt_select", side_effect=capture_prompts), patch.object(
+        cli.inquirer, "select", side_effect=[_answer(a) for a in select_answers]
     ):
         result = _run_sanity_stage(
-            console=Console(),
+            **sanity_defaults,
             statement=_minimal_statement(),
-            pdf_name="stmt.pdf",
             extracted_count=1,
-            raw_response=None,
-            validation_issues=[],
-            dev_non_interactive=False,
             source_path=None,
-            recovery_mode=False,
         )
     assert result is not None
-    # After L4 Back we should see L3 again (inquirer), then L2b "Edit transactions:", then L2 "Edit:", then L1 "Sanity check:"
+    # Whole sequence consumed: every Back landed on the level the next answer expects.
+    assert next(answers, None) is None
     assert "Edit transactions:" in captured
     assert "Edit:" in captured
-    assert any("Sanity check" in m for m in captured)
-
-
-def test_sanity_back_from_l3_returns_to_l2b(tmp_path: Path) -> None:
-    """Back from Select transaction (L3) returns to Edit transactions menu (L2b); then Back→L2, Back→L1, Accept."""
-    from rich.console import Console
-
-    # L1 → Edit → edit_tx → edit_one → inquirer Back → L2b back → L2 back → accept
-    with patch("pdf2ofx.cli._prompt_select", side_effect=[
-        "edit", "edit_tx", "edit_one",
-        "back", "back", "accept",
-    ]), patch("pdf2ofx.cli.inquirer.select", return_value=MagicMock(execute=MagicMock(return_value="__back__"))):
-        result = _run_sanity_stage(
-            console=Console(),
-            statement=_minimal_statement(),
-            pdf_name="stmt.pdf",
-            extracted_count=1,
-            raw_response=None,
-            validation_issues=[],
-            dev_non_interactive=False,
-            source_path=None,
-            recovery_mode=False,
-        )
-    assert result is not None
-
+    assert "Sanity check" in captured[-1]
 
-def test_sanity_back_from_l2b_returns_to_l2(tmp_path: Path) -> None:
-    """Back from Edit transactions (L2b) returns to Edit submenu (L2); then Back→L1, Accept."""
-    from rich.console import Console
 
-    with patch("pdf2ofx.cli._prompt_select", side_effect=["edit", "edit_tx", "back", "back", "accept"]):
-        result = _run_sanity_stage(
-            console=Console(),
-            statement=_minimal_statement(),
-            pdf_name="stmt.pdf",
-            extracted_count=1,
-            raw_response=None,
-            validation_issues=[],
-            dev_non_interactive=False,
-            source_path=None,
-            recovery_mode=False,
-        )
-    assert result is not None
-
-
-def test_sanity_after_invert_returns_to_l3_not_l1(tmp_path: Path) -> None:
+def test_sanity_after_invert_returns_to_l3_not_l1(tmp_path: Path, sanity_defaults: dict) -> None:
     """After Invert sign we return to transaction list (L3); next _prompt_select is L2b only after Back from L3."""
-    from rich.console import Console
-
     order: list[str] = []
 
     def track(msg: str, choices: list[tuple[str, str]], default: str) -> str:
@@ -733,21 +610,17 @@ def test_sanity_after_invert_returns_to_l3_not_l1(tmp_path: Path) -> None:
         "back", "back", "accept",
     ])
 
-    with patch("pdf2ofx.cli._prompt_select", side_effect=track), patch("pdf2ofx.cli.inquirer.select", side_effect=[
-        MagicMock(execute=MagicMock(return_value=0)),
-        MagicMock(execute=MagicMock(return_value="__back__")),
+    with patch.object(cli, "_prompt_select", side_effect=track), patch.object(cli.inquirer, "select", side_effect=[
+        _answer(0),
+        _answer("__back__"),
     ]):
         _run_sanity_stage(
-            console=Console(),
+            **sanity_defaults,
             statement=_statement_one_tx_amount_100(),
-            pdf_name="stmt.pdf",
             extracted_count=1,
-            raw_response=None,
-            validation_issues=[],
-            dev_non_interactive=False,
             source_path=None,
-            recovery_mode=False,
         )
+    assert next(_invert_return_sequence, None) is None  # every scripted answer was consumed
     # After invert we return to L3; when we Back from L3 we see L2b "Edit transactions:" before we Back to L1 "Sanity check:".
     # So the last "Edit transactions:" must appear before the last "Sanity check:".
     idx_edit_tx_last = max((i for i, m in enumerate(order) if m == "Edit transactions:"), default=None)
@@ -756,10 +629,8 @@ def test_sanity_after_invert_returns_to_l3_not_l1(tmp_path: Path) -> None:
     assert idx_edit_tx_last < idx_sanity_last
 
 
-def test_sanity_after_triage_confirm_returns_to_l2_not_l1(tmp_path: Path) -> None:
+def test_sanity_after_triage_confirm_returns_to_l2_not_l1(tmp_path: Path, sanity_defaults: dict) -> None:
     """After triage Validate/Flag confirm we return to Edit submenu (L2); next prompt is Edit: with edit_tx/edit_bal/triage/back."""
-    from rich.console import Console
-
     edit_prompts: list[tuple[str, list[tuple[str, str]]]] = []
 
     def capture_edit_prompts(msg: str, choices: list[tuple[str, str]], default: str) -> str:
@@ -772,20 +643,18 @@ def test_sanity_after_triage_confirm_returns_to_l2_not_l1(tmp_path: Path) -> Non
         "edit_tx", "back", "back", "accept",
     ])
 
-    with patch("pdf2ofx.cli._prompt_select", side_effect=capture_edit_prompts), patch(
-        "pdf2ofx.cli.inquirer.checkbox", return_value=MagicMock(execute=MagicMock(return_value=[0]))
-    ), patch("pdf2ofx.cli._prompt_confirm", return_value=True):
+    with patch.multiple(
+        cli,
+        _prompt_select=MagicMock(side_effect=capture_edit_prompts),
+        _prompt_confirm=MagicMock(return_value=True),
+    ), patch.object(cli.inquirer, "checkbox", return_value=_answer([0])):
         _run_sanity_stage(
-            console=Console(),
+            **sanity_defaults,
             statement=_statement_with_three_tx(),
-            pdf_name="stmt.pdf",
             extracted_count=3,
-            raw_response=None,
-            validation_issues=[],
-            dev_non_interactive=False,
             source_path=None,
-            recovery_mode=False,
         )
+    assert next(_triage_return_sequence, None) is None  # every scripted answer was consumed
     # First "Edit:" when we enter L2; second "Edit:" after triage confirm (return to L2, not L1).
     assert len(edit_prompts) >= 2
     _, choices_after_triage = edit_prompts[1]
@@ -793,20 +662,83 @@ def test_sanity_after_triage_confirm_returns_to_l2_not_l1(tmp_path: Path) -> Non
     assert "edit_tx" in values and "back" in values
 
 
-def test_sanity_recovery_back_to_list_exits_sanity(tmp_path: Path) -> None:
+def test_sanity_recovery_back_to_list_exits_sanity(tmp_path: Path, sanity_defaults: dict) -> None:
     """In recovery_mode, choosing Back to list at L1 raises RecoveryBackRequested (exit SANITY to list)."""
-    from rich.console import Console
-
-    with patch("pdf2ofx.cli._prompt_select", return_value="back_to_list"):
+    with patch.object(cli, "_prompt_select", return_value="back_to_list"):
         with pytest.raises(RecoveryBackRequested):
             _run_sanity_stage(
-                console=Console(),
+                **{**sanity_defaults, "recovery_mode": True},
                 statement=_minimal_statement(),
-                pdf_name="stmt.pdf",
                 extracted_count=1,
-                raw_response=None,
-                validation_issues=[],
-                dev_non_interactive=False,
                 source_path=None,
-                recovery_mode=True,
             )
+
+
+def test_parse_amount_input_strips_thousands_separators() -> None:
+    """Operator-typed amounts accept comma, NBSP and space grouping."""
+    assert _parse_amount_input(" 1,234.50 ") == Decimal("1234.50")
+    assert _parse_amount_input("-1\u00a0234.5") == Decimal("-1234.5")
+    assert _parse_amount_input("12 000") == Decimal("12000")
+    with pytest.raises(InvalidOperation):
+        _parse_amount_input("abc")
+
+
+def test_get_sources_to_open_preserves_first_seen_order() -> None:
+    """Sources needing a visual check come back in first-seen order, without duplicates."""
+    sources = [Path(f"in/{name}.pdf") for name in ("c", "a", "b")]
+    statements = [
+        ProcessItem(name="b", statement={"transactions": [{"fitid": "FB"}]}),
+        ProcessItem(name="a", statement={"transactions": [{"fitid": "FA"}]}),
+        ProcessItem(name="c", statement={"transactions": [{"fitid": "FC"}]}),
+    ]
+    # No balances → every result carries a warning and needs a visual check.
+    sanity_results = [
+        compute_sanity(item.statement, f"{item.name}.pdf", 1) for item in statements
+    ]
+    issues = [Issue(severity=Severity.ERROR, reason="x", fitids=["FA", "FC"], count=2)]
+    got = _get_sources_to_open(issues, sanity_results, statements, sources)
+    assert got == [Path("in/b.pdf"), Path("in/a.pdf"), Path("in/c.pdf")]
+
+
+def test_inference_prefetch_returns_each_pdf_response_with_bounded_lookahead(tmp_path: Path) -> None:
+    pdfs = [tmp_path / f"{name}.pdf" for name in ("a", "b", "c", "d")]
+    uploaded: list[str] = []
+
+    def fake_infer(key: str, model: str, path: Path) -> dict:
+        uploaded.append(path.name)
+        return {"pdf": path.name}
+
+    with patch.object(cli, "infer_pdf", side_effect=fake_infer):
+        inferences = _InferencePrefetch(pdfs, "key", "model", lookahead=1)
+        try:
+            assert inferences.result(pdfs[0]) == {"pdf": "a.pdf"}
+            # Only the current PDF and one ahead are ever uploaded.
+            assert set(uploaded) <= {"a.pdf", "b.pdf"}
+            assert [inferences.result(p)["pdf"] for p in pdfs[1:]] == ["b.pdf", "c.pdf", "d.pdf"]
+        finally:
+            inferences.close()
+    assert sorted(uploaded) == ["a.pdf", "b.pdf", "c.pdf", "d.pdf"]
+
+
+def test_inference_prefetch_close_cancels_queued_uploads(tmp_path: Path) -> None:
+    pdfs = [tmp_path / f"{name}.pdf" for name in ("a", "b", "c", "d")]
+    uploaded: list[str] = []
+
+    def fake_infer(key: str, model: str, path: Path) -> dict:
+        uploaded.append(path.name)
+        return {"pdf": path.name}
+
+    with patch.object(cli, "infer_pdf", side_effect=fake_infer):
+        inferences = _InferencePrefetch(pdfs, "key", "model", lookahead=1)
+        assert inferences.result(pdfs[0]) == {"pdf": "a.pdf"}
+        inferences.close()
+        with pytest.raises(CancelledError):
+            inferences.result(pdfs[2])
+    assert set(uploaded) <= {"a.pdf", "b.pdf"}
+
+
+def test_inference_prefetch_starts_nothing_for_empty_list() -> None:
+    with patch.object(cli, "infer_pdf") as infer:
+        inferences = _InferencePrefetch([], "key", "model")
+        inferences.close()
+    infer.assert_not_called()
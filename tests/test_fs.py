@@ -1,19 +1,30 @@
 """Tests for helpers/fs."""
 from __future__ import annotations
 
+import errno
 import json
+import math
+import os
 from decimal import Decimal
 from pathlib import Path
 
 import pytest
 
 from pdf2ofx.converters.ofx_emitter import emit_ofx
+from pdf2ofx.helpers import fs
 from pdf2ofx.helpers.fs import (
+    clear_transaction_line_cache,
     ensure_recovery_dir,
+    list_pdfs,
     list_tmp_jsons,
+    move_file,
+    normalize_ofx_filename,
+    read_json,
     read_tmp_meta,
     resolve_source_path_from_meta,
+    safe_delete_dir,
     selective_tmp_cleanup,
+    tmp_json_path,
     transaction_line_numbers,
     write_json,
     write_tmp_meta,
@@ -51,6 +62,63 @@ def test_transaction_line_numbers_v2(tmp_path: Path) -> None:
     assert lines[0] < lines[1]
 
 
+def _write_v2_tmp_json(path: Path, n_items: int) -> None:
+    payload = {"inference": {"result": {"fields": {"transactions": {
+        "items": [{"fields": {}} for _ in range(n_items)],
+    }}}}}
+    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+def test_transaction_line_numbers_cached_until_file_changes(tmp_path: Path) -> None:
+    """Repeated calls hit the cache; rewriting the file invalidates it."""
+    clear_transaction_line_cache()
+    json_path = tmp_path / "v2.json"
+    _write_v2_tmp_json(json_path, 1)
+    first = transaction_line_numbers(json_path)
+    assert len(first) == 1
+    first.append(99)  # callers get a copy, never the cached value
+    assert len(transaction_line_numbers(json_path)) == 1
+
+    _write_v2_tmp_json(json_path, 3)
+    assert len(transaction_line_numbers(json_path)) == 3
+
+
+def test_transaction_line_numbers_any_formatting(tmp_path: Path) -> None:
+    """Item positions come from the JSON structure, not from indentation."""
+    payload = {"document": {"inference": {"prediction": {
+        "Transactions": [{"a": "{"}, {"b": [{"c": 1}]}, {}],
+    }}}}
+    json_path = tmp_path / "v1.json"
+    json_path.write_text(json.dumps(payload), encoding="utf-8")
+    assert transaction_line_numbers(json_path) == [1, 1, 1]
+
+    json_path.write_text(json.dumps(payload, indent=4).replace("\n", "\r\n"), encoding="utf-8")
+    text_lines = json_path.read_bytes().split(b"\n")
+    got = transaction_line_numbers(json_path)
+    assert [text_lines[n - 1].strip() for n in got] == [b"{", b"{", b"{}"]
+
+
+def test_transaction_line_numbers_lookup_order_not_file_order(tmp_path: Path) -> None:
+    """All candidate paths are found in one walk; V2 wins even when it comes last."""
+    json_path = tmp_path / "both.json"
+    json_path.write_text(
+        '{"document":{"inference":{"prediction":{"Transactions":[{}]}}},\n'
+        '"inference":{"prediction":{"transactions":[{}]},\n'
+        '"result":{"fields":{"transactions":{"items":[{},\n{}]}}}}}',
+        encoding="utf-8",
+    )
+    assert transaction_line_numbers(json_path) == [3, 4]
+
+
+def test_transaction_line_numbers_last_duplicate_key_wins(tmp_path: Path) -> None:
+    json_path = tmp_path / "dup.json"
+    json_path.write_text(
+        '{"inference":{"prediction":{"Transactions":[{}]}},\n"inference":{"x":1}}',
+        encoding="utf-8",
+    )
+    assert transaction_line_numbers(json_path) == []
+
+
 def test_transaction_line_numbers_missing_file(tmp_path: Path) -> None:
     assert transaction_line_numbers(tmp_path / "nonexistent.json") == []
 
@@ -64,6 +132,24 @@ def test_transaction_line_numbers_empty_items(tmp_path: Path) -> None:
     assert transaction_line_numbers(json_path) == []
 
 
+def test_list_pdfs_sorted_case_insensitive_files_only(tmp_path: Path) -> None:
+    (tmp_path / "b.PDF").write_bytes(b"%PDF")
+    (tmp_path / "a.pdf").write_bytes(b"%PDF")
+    (tmp_path / "notes.txt").write_text("x", encoding="utf-8")
+    (tmp_path / "folder.pdf").mkdir()
+    assert [p.name for p in list_pdfs(tmp_path)] == ["a.pdf", "b.PDF"]
+
+
+def test_list_pdfs_and_tmp_jsons_skip_bare_suffix_names(tmp_path: Path) -> None:
+    """A file named exactly ``.pdf`` / ``.json`` has no suffix, as with Path.suffix."""
+    (tmp_path / ".pdf").write_bytes(b"%PDF")
+    (tmp_path / ".json").write_text("{}", encoding="utf-8")
+    (tmp_path / "x.Pdf").write_bytes(b"%PDF")
+    (tmp_path / "x.json").write_text("{}", encoding="utf-8")
+    assert [p.name for p in list_pdfs(tmp_path)] == ["x.Pdf"]
+    assert [p.name for p in list_tmp_jsons(tmp_path)] == ["x.json"]
+
+
 # ---------------------------------------------------------------------------
 # list_tmp_jsons: recovery candidates (hard rule)
 # ---------------------------------------------------------------------------
@@ -91,6 +177,13 @@ def test_list_tmp_jsons_excludes_recovery_subdir(tmp_path: Path) -> None:
     assert got[0].name == "top.json"
 
 
+def test_list_tmp_jsons_skips_json_named_directories(tmp_path: Path) -> None:
+    (tmp_path / "top.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "nested.json").mkdir()
+    (tmp_path / "nested.json" / "inner.json").write_text("{}", encoding="utf-8")
+    assert [p.name for p in list_tmp_jsons(tmp_path)] == ["top.json"]
+
+
 def test_list_tmp_jsons_excludes_raw_and_canonical_suffix(tmp_path: Path) -> None:
     """Exclude *.raw.json and *.canonical.json even in top-level tmp."""
     (tmp_path / "plain.json").write_text("{}", encoding="utf-8")
@@ -137,6 +230,57 @@ def test_selective_tmp_cleanup_deletes_clean_keeps_rest(tmp_path: Path) -> None:
     assert kept == ["dirty.json — reconciliation ERROR"]
 
 
+def test_safe_delete_dir_ignores_only_a_missing_top_dir(tmp_path: Path, monkeypatch) -> None:
+    safe_delete_dir(tmp_path / "missing")
+    target = tmp_path / "tmp"
+    (target / "sub").mkdir(parents=True)
+
+    def rmtree_child_gone(path: Path) -> None:
+        raise FileNotFoundError(errno.ENOENT, "No such file or directory", str(path / "sub"))
+
+    monkeypatch.setattr(fs.shutil, "rmtree", rmtree_child_gone)
+    with pytest.raises(FileNotFoundError):
+        safe_delete_dir(target)
+
+
+def test_move_file_renames_and_falls_back_across_devices(tmp_path: Path, monkeypatch) -> None:
+    """Same-device moves rename; EXDEV falls back to shutil.move."""
+    src = tmp_path / "a.pdf"
+    src.write_bytes(b"%PDF")
+    dst_dir = tmp_path / "processed"
+    dst_dir.mkdir()
+    move_file(src, dst_dir / "a.pdf")
+    assert not src.exists()
+    assert (dst_dir / "a.pdf").read_bytes() == b"%PDF"
+
+    def cross_device(*_args):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(os, "replace", cross_device)
+    move_file(dst_dir / "a.pdf", tmp_path / "b.pdf")
+    assert (tmp_path / "b.pdf").read_bytes() == b"%PDF"
+    assert not (dst_dir / "a.pdf").exists()
+
+
+def test_normalize_ofx_filename_strips_ascii_and_non_ascii() -> None:
+    """Account id keeps ASCII alphanumerics only; period keeps digits and dashes."""
+    name = normalize_ofx_filename("ACC-123 / 45", "2024-01-31", "a.pdf")
+    assert name.startswith("ACC12345_2024-01-31_")
+    assert name.endswith(".ofx")
+    assert len(name) == len("ACC12345_2024-01-31_") + 4 + len(".ofx")
+    name = normalize_ofx_filename("Compte n°12é", "2024/01/31", "a.pdf")
+    assert name.startswith("Compten12_20240131_")
+
+
+def test_tmp_slug_and_ofx_uid_are_pinned() -> None:
+    """Both names feed on-disk state (tmp recovery, output/ dedupe): change them deliberately."""
+    assert tmp_json_path(Path("tmp"), "releve_2024-01") == Path("tmp/0f4616b0efe1.json")
+    assert (
+        normalize_ofx_filename("00020866101", "2025-02-28", "releve_2025-02.pdf")
+        == "00020866101_2025-02-28_415f.ofx"
+    )
+
+
 # ---------------------------------------------------------------------------
 # write_json with decimal_to_str: canonical statement persistence
 # ---------------------------------------------------------------------------
@@ -168,8 +312,7 @@ def test_write_json_decimal_to_str_roundtrip_and_reparse(tmp_path: Path) -> None
     stmt = _minimal_canonical_statement_with_decimal()
     path = tmp_path / "canon.json"
     write_json(path, stmt, decimal_to_str=True)
-    raw = path.read_text(encoding="utf-8")
-    loaded = json.loads(raw)
+    loaded = json.loads(path.read_bytes())
     assert loaded["transactions"][0]["amount"] == "-3.50"
     assert loaded["transactions"][0]["debit"] == "3.50"
     assert loaded["transactions"][0]["credit"] is None
@@ -177,12 +320,47 @@ def test_write_json_decimal_to_str_roundtrip_and_reparse(tmp_path: Path) -> None
     assert Decimal(loaded["transactions"][0]["debit"]) == Decimal("3.50")
 
 
+def test_write_json_same_bytes_with_and_without_orjson(tmp_path: Path, monkeypatch) -> None:
+    """For a canonical statement (no floats) the orjson path writes what stdlib json would."""
+    payload = _minimal_canonical_statement_with_decimal()
+    payload["account"]["label"] = "Compte courant — é"
+    fast_path = tmp_path / "fast.json"
+    write_json(fast_path, payload, decimal_to_str=True)
+    monkeypatch.setattr(fs, "orjson", None)
+    std_path = tmp_path / "std.json"
+    write_json(std_path, payload, decimal_to_str=True)
+    assert fast_path.read_bytes() == std_path.read_bytes()
+    assert fs.load_local_settings(fast_path) == json.loads(std_path.read_bytes())
+    assert fs.read_json(std_path) == json.loads(std_path.read_bytes())
+
+
+def test_write_json_floats_and_big_ints_with_and_without_orjson(tmp_path: Path, monkeypatch) -> None:
+    """Float spelling may differ between encoders; read_json gets the same data back, big ints included."""
+    payload = {"small": 1e-7, "large": 1e20, "ratio": 0.15, "big": 2**64, "neg": -(2**70)}
+    fast_path = tmp_path / "fast.json"
+    write_json(fast_path, payload)
+    assert fs.read_json(fast_path) == payload
+    monkeypatch.setattr(fs, "orjson", None)
+    std_path = tmp_path / "std.json"
+    write_json(std_path, payload)
+    assert fs.read_json(std_path) == payload
+    assert type(fs.read_json(std_path)["big"]) is int
+
+
+def test_read_json_accepts_bom_and_nan(tmp_path: Path) -> None:
+    path = tmp_path / "bom.json"
+    path.write_bytes(b'\xef\xbb\xbf{"ratio": NaN, "id": 18446744073709551616}')
+    data = read_json(path)
+    assert math.isnan(data["ratio"])
+    assert data["id"] == 2**64
+
+
 def test_write_json_decimal_to_str_downstream_compatibility(tmp_path: Path) -> None:
     """Loaded canonical JSON (string amounts) is accepted by validate_statement and emit_ofx."""
     stmt = _minimal_canonical_statement_with_decimal()
     path = tmp_path / "canon.json"
     write_json(path, stmt, decimal_to_str=True)
-    loaded = json.loads(path.read_text(encoding="utf-8"))
+    loaded = json.loads(path.read_bytes())
     result = validate_statement(loaded)
     assert result.statement is not None
     payload = emit_ofx(result.statement, "OFX2")
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import re
 from decimal import Decimal
+from pathlib import Path
 
-from pdf2ofx.converters.ofx_emitter import emit_ofx
+from pdf2ofx.converters import ofx_emitter
+from pdf2ofx.converters.ofx_emitter import _split_name_memo, emit_ofx, emit_ofx_to_path
 from pdf2ofx.validators.contract_validator import validate_statement
 from pdf2ofx.normalizers.fitid import assign_fitids
 
@@ -42,3 +45,31 @@ def test_ofx2_emission_contains_required_tags() -> None:
     assert "<BANKACCTFROM>" in text
     assert "<STMTTRN>" in text
     assert "<FITID>" in text
+
+
+def test_split_name_memo_truncates_at_word_boundary() -> None:
+    assert _split_name_memo("Short name", "memo") == ("Short name", "memo")
+    long_name = "CARD PAYMENT SUPERMARKET DOWNTOWN 1234"
+    name, memo = _split_name_memo(long_name, "ref 42")
+    assert name == "CARD PAYMENT SUPERMARKET"
+    assert memo == f"{long_name} | ref 42"
+    # No space past the 10-char floor → hard cut at 32
+    name, memo = _split_name_memo("A" * 40, None)
+    assert name == "A" * 32
+    assert memo == "A" * 40
+
+
+def test_emit_ofx_to_path_matches_in_memory_payload(tmp_path: Path) -> None:
+    def _strip_dtserver(payload: bytes) -> bytes:
+        return re.sub(rb"<DTSERVER>[^<\r\n]*", b"<DTSERVER>", payload)
+
+    for fmt in ("OFX2", "OFX1"):
+        out_path = tmp_path / f"out_{fmt}.ofx"
+        emit_ofx_to_path(_statement(), out_path, fmt)
+        assert _strip_dtserver(out_path.read_bytes()) == _strip_dtserver(emit_ofx(_statement(), fmt))
+        assert not out_path.with_suffix(".ofx.tmp").exists()
+
+
+def test_fast_ofx1_writer_matches_ofxtools() -> None:
+    ofx = ofx_emitter._build_ofx(_statement())
+    assert ofx_emitter._serialize_ofx1(ofx) == ofx_emitter._client_for("OFX1").serialize(ofx)
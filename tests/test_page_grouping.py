@@ -105,6 +105,15 @@ def test_get_page_groups_mixed_unknown_last() -> None:
     assert [i for i, _ in groups[2][1]] == [1]
 
 
+def test_get_page_groups_orders_by_page_for_large_indices() -> None:
+    transactions = [{"amount": Decimal("1"), "name": "X", "page": 3}] * 10006
+    transactions[0] = {"amount": Decimal("2"), "name": "A", "page": 2}
+    transactions[10005] = {"amount": Decimal("4"), "name": "B", "page": 1}
+    groups = get_page_groups(transactions, [0, 10005])
+    assert groups is not None
+    assert [g[0] for g in groups] == ["Page 1", "Page 2"]
+
+
 # ---------------------------------------------------------------------------
 # format_separator_line
 # ---------------------------------------------------------------------------
@@ -5,6 +5,7 @@ from decimal import Decimal
 
 import pytest
 
+from pdf2ofx.helpers.reporting import Issue, Severity
 from pdf2ofx.sanity.checks import (
     SanityResult,
     compute_quality_score,
@@ -65,147 +66,139 @@ def _base_statement(
 # compute_reconciliation
 # ---------------------------------------------------------------------------
 
-class TestComputeReconciliation:
-
-    def test_ok(self) -> None:
-        rec_end, delta, status = compute_reconciliation(
+@pytest.mark.parametrize(
+    ("starting", "ending", "net", "expected_end", "expected_delta", "expected_status"),
+    [
+        pytest.param(
             Decimal("100000"), Decimal("436000"), Decimal("336000"),
-        )
-        assert status == "OK"
-        assert rec_end == Decimal("436000")
-        assert delta == Decimal("0")
-
-    def test_warning_small_delta(self) -> None:
-        _, delta, status = compute_reconciliation(
+            Decimal("436000"), Decimal("0"), "OK",
+            id="ok",
+        ),
+        pytest.param(
             Decimal("100000"), Decimal("436000"), Decimal("336000.50"),
-        )
-        assert status == "WARNING"
-        assert abs(delta) <= Decimal("1.00")
-
-    def test_error_large_delta(self) -> None:
-        _, delta, status = compute_reconciliation(
+            Decimal("436000.50"), Decimal("0.50"), "WARNING",
+            id="warning_small_delta",
+        ),
+        pytest.param(
             Decimal("100000"), Decimal("436000"), Decimal("340000"),
-        )
-        assert status == "ERROR"
-        assert abs(delta) > Decimal("1.00")
-
-    def test_skipped_no_starting(self) -> None:
-        rec_end, delta, status = compute_reconciliation(
+            Decimal("440000"), Decimal("4000"), "ERROR",
+            id="error_large_delta",
+        ),
+        pytest.param(
             None, Decimal("436000"), Decimal("336000"),
-        )
-        assert status == "SKIPPED"
-        assert rec_end is None
-        assert delta is None
-
-    def test_skipped_no_ending(self) -> None:
-        _, _, status = compute_reconciliation(
+            None, None, "SKIPPED",
+            id="skipped_no_starting",
+        ),
+        pytest.param(
             Decimal("100000"), None, Decimal("336000"),
-        )
-        assert status == "SKIPPED"
-
-    def test_skipped_both_missing(self) -> None:
-        _, _, status = compute_reconciliation(None, None, Decimal("0"))
-        assert status == "SKIPPED"
-
-    def test_exact_penny_boundary(self) -> None:
-        """abs(delta) == 0.01 should be OK."""
-        _, delta, status = compute_reconciliation(
+            None, None, "SKIPPED",
+            id="skipped_no_ending",
+        ),
+        pytest.param(
+            None, None, Decimal("0"),
+            None, None, "SKIPPED",
+            id="skipped_both_missing",
+        ),
+        # abs(delta) == 0.01 is still OK; 0.02 is WARNING.
+        pytest.param(
             Decimal("100"), Decimal("200"), Decimal("100.01"),
-        )
-        assert status == "OK"
-        assert delta == Decimal("0.01")
-
-    def test_just_over_penny_boundary(self) -> None:
-        """abs(delta) == 0.02 should be WARNING."""
-        _, delta, status = compute_reconciliation(
+            Decimal("200.01"), Decimal("0.01"), "OK",
+            id="exact_penny_boundary",
+        ),
+        pytest.param(
             Decimal("100"), Decimal("200"), Decimal("100.02"),
-        )
-        assert status == "WARNING"
+            Decimal("200.02"), Decimal("0.02"), "WARNING",
+            id="just_over_penny_boundary",
+        ),
+    ],
+)
+def test_compute_reconciliation(
+    starting: Decimal | None,
+    ending: Decimal | None,
+    net: Decimal,
+    expected_end: Decimal | None,
+    expected_delta: Decimal | None,
+    expected_status: str,
+) -> None:
+    rec_end, delta, status = compute_reconciliation(starting, ending, net)
+    assert status == expected_status
+    assert rec_end == expected_end
+    assert delta == expected_delta
 
 
 # ---------------------------------------------------------------------------
 # compute_quality_score
 # ---------------------------------------------------------------------------
 
-class TestComputeQualityScore:
-
-    def test_perfect(self) -> None:
-        score, label, deductions = compute_quality_score(
-            reconciliation_status="OK",
-            balances_missing=False,
-            drop_ratio=0.0,
-            warning_count=0,
-        )
-        assert score == 100
-        assert label == "GOOD"
-        assert deductions == []
-
-    def test_error_drops_to_poor(self) -> None:
-        score, label, deductions = compute_quality_score(
-            reconciliation_status="ERROR",
-            balances_missing=False,
-            drop_ratio=0.0,
-            warning_count=0,
-        )
-        assert score == 40
-        assert label == "POOR"
-        assert ("Reconciliation error", -60) in deductions
-
-    def test_balances_missing(self) -> None:
-        score, label, deductions = compute_quality_score(
-            reconciliation_status="SKIPPED",
-            balances_missing=True,
-            drop_ratio=0.0,
-            warning_count=0,
-        )
-        assert score == 75
-        assert label == "DEGRADED"
-        assert ("Balances missing", -25) in deductions
-
-    def test_high_drop_rate(self) -> None:
-        score, label, deductions = compute_quality_score(
-            reconciliation_status="OK",
-            balances_missing=False,
-            drop_ratio=0.15,
-            warning_count=0,
-        )
-        assert score == 85
-        assert label == "GOOD"
-        assert any("drop rate" in r for r, _ in deductions)
-
-    def test_warnings_capped(self) -> None:
-        """Warning deduction is capped at 30."""
-        score, _, deductions = compute_quality_score(
-            reconciliation_status="OK",
-            balances_missing=False,
-            drop_ratio=0.0,
-            warning_count=10,
-        )
-        assert score == 70  # 100 - min(100, 30)
-        assert ("10 validation warning(s)", -30) in deductions
-
-    def test_low_confidence(self) -> None:
-        score, _, deductions = compute_quality_score(
-            reconciliation_status="OK",
-            balances_missing=False,
-            drop_ratio=0.0,
-            warning_count=0,
-            low_mindee_confidence=True,
-        )
-        assert score == 85
-        assert ("Low Mindee confidence", -15) in deductions
-
-    def test_floor_at_zero(self) -> None:
-        score, label, deductions = compute_quality_score(
-            reconciliation_status="ERROR",
-            balances_missing=True,
-            drop_ratio=0.5,
-            warning_count=5,
-            low_mindee_confidence=True,
-        )
-        assert score == 0
-        assert label == "POOR"
-        assert len(deductions) == 5  # all deductions present
+_CLEAN_SCORE_INPUTS = {
+    "reconciliation_status": "OK",
+    "balances_missing": False,
+    "drop_ratio": 0.0,
+    "warning_count": 0,
+}
+
+
+@pytest.mark.parametrize(
+    ("overrides", "expected_score", "expected_label", "expected_deductions"),
+    [
+        pytest.param({}, 100, "GOOD", [], id="perfect"),
+        pytest.param(
+            {"reconciliation_status": "ERROR"},
+            40, "POOR", [("Reconciliation error", -60)],
+            id="error_drops_to_poor",
+        ),
+        pytest.param(
+            {"reconciliation_status": "SKIPPED", "balances_missing": True},
+            75, "DEGRADED", [("Balances missing", -25)],
+            id="balances_missing",
+        ),
+        pytest.param(
+            {"drop_ratio": 0.15},
+            85, "GOOD", [("High drop rate (15%)", -15)],
+            id="high_drop_rate",
+        ),
+        # Warning deduction is capped at 30.
+        pytest.param(
+            {"warning_count": 10},
+            70, "DEGRADED", [("10 validation warning(s)", -30)],
+            id="warnings_capped",
+        ),
+        pytest.param(
+            {"low_mindee_confidence": True},
+            85, "GOOD", [("Low Mindee confidence", -15)],
+            id="low_confidence",
+        ),
+        # Every deduction applies and the score floors at zero.
+        pytest.param(
+            {
+                "reconciliation_status": "ERROR",
+                "balances_missing": True,
+                "drop_ratio": 0.5,
+                "warning_count": 5,
+                "low_mindee_confidence": True,
+            },
+            0, "POOR",
+            [
+                ("Reconciliation error", -60),
+                ("Balances missing", -25),
+                ("High drop rate (50%)", -15),
+                ("5 validation warning(s)", -30),
+                ("Low Mindee confidence", -15),
+            ],
+            id="floor_at_zero",
+        ),
+    ],
+)
+def test_compute_quality_score(
+    overrides: dict,
+    expected_score: int,
+    expected_label: str,
+    expected_deductions: list[tuple[str, int]],
+) -> None:
+    score, label, deductions = compute_quality_score(**{**_CLEAN_SCORE_INPUTS, **overrides})
+    assert score == expected_score
+    assert label == expected_label
+    assert deductions == expected_deductions
 
 
 # ---------------------------------------------------------------------------
@@ -250,6 +243,16 @@ class TestExtractBalances:
         assert start == Decimal("5000.50")
         assert end == Decimal("7500.25")
 
+    def test_falls_through_malformed_paths(self) -> None:
+        raw = {
+            "document": "not-a-dict",
+            "inference": {
+                "prediction": {},
+                "result": {"fields": {"ending_balance": "42"}},
+            },
+        }
+        assert extract_balances(raw) == (None, Decimal("42"))
+
     def test_partial_only_starting(self) -> None:
         raw = {
             "document": {
@@ -415,6 +418,23 @@ class TestComputeSanity:
         assert result.ending_balance == Decimal("436000")
         assert result.reconciliation_status == "OK"
 
+    def test_counts_only_warning_issues(self) -> None:
+        stmt = _base_statement()
+        issues = [
+            Issue(severity=Severity.WARNING, reason="a"),
+            Issue(severity=Severity.ERROR, reason="b"),
+            Issue(severity=Severity.WARNING, reason="c"),
+        ]
+        result = compute_sanity(
+            statement=stmt,
+            pdf_name="test.pdf",
+            extracted_count=2,
+            validation_issues=issues,
+            starting_balance=Decimal("100000"),
+            ending_balance=Decimal("436000"),
+        )
+        assert result.quality_score == 80  # 2 warnings x -10
+
 
 def test_is_clean_for_tmp_delete_and_keep_reason() -> None:
     """Selective tmp cleanup: clean only when OK, GOOD, not skipped, not forced_accept."""
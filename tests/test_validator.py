@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from decimal import Decimal
 
+import pytest
+
 from pdf2ofx.helpers.reporting import Severity
 from pdf2ofx.validators.contract_validator import validate_statement
 
@@ -51,32 +53,57 @@ def test_validator_debit_credit_conflict() -> None:
     assert any(issue.severity == Severity.WARNING for issue in result.issues)
 
 
-def test_validator_page_valid_passes() -> None:
+_PAGE_INVALID = [(Severity.WARNING, "transaction page invalid; key removed")]
+
+
+@pytest.mark.parametrize(
+    ("page", "expected_page", "expected_issues"),
+    [
+        pytest.param(1, 1, [], id="valid"),
+        # Tx with page 0 or non-int gets WARNING and page key removed but tx is still kept.
+        pytest.param(0, None, _PAGE_INVALID, id="zero"),
+        pytest.param("one", None, _PAGE_INVALID, id="non_int"),
+    ],
+)
+def test_validator_page(
+    page: object, expected_page: int | None, expected_issues: list[tuple[Severity, str]]
+) -> None:
     statement = _base_statement()
-    statement["transactions"][0]["page"] = 1
+    statement["transactions"][0]["page"] = page
     result = validate_statement(statement)
     assert len(result.statement["transactions"]) == 1
-    assert result.statement["transactions"][0].get("page") == 1
-    assert not any(issue.reason == "transaction page invalid; key removed" for issue in result.issues)
+    assert result.statement["transactions"][0].get("page") == expected_page
+    page_issues = [(i.severity, i.reason) for i in result.issues if "page" in i.reason]
+    assert page_issues == expected_issues
 
 
-def test_validator_page_invalid_warning_and_key_removed_tx_kept() -> None:
-    """Tx with page 0 or non-int gets WARNING and page key removed but tx is still kept."""
+def test_validator_skip_transaction_checks_keeps_cross_statement_checks() -> None:
+    """Pre-validated statements skip per-tx checks but still dedupe FITIDs and check the period."""
     statement = _base_statement()
-    statement["transactions"][0]["page"] = 0
-    result = validate_statement(statement)
-    assert len(result.statement["transactions"]) == 1
-    assert "page" not in result.statement["transactions"][0]
-    assert any(
-        issue.severity == Severity.WARNING and "transaction page invalid" in issue.reason
-        for issue in result.issues
-    )
+    tx = statement["transactions"][0]
+    tx["credit"] = Decimal("1.00")  # would warn under full validation
+    statement["transactions"].append(dict(tx))  # duplicate FITID
+    statement["transactions"].append(dict(tx, fitid="FIT2", posted_at="2024-02-15"))
+    result = validate_statement(statement, skip_transaction_checks=True)
+    reasons = {issue.reason for issue in result.issues}
+    assert reasons == {
+        "transaction fitid is not unique",
+        "transaction outside statement period",
+    }
+    assert [t["fitid"] for t in result.statement["transactions"]] == ["FIT1", "FIT2"]
+    assert "trntype" not in result.statement["transactions"][0]
 
 
-def test_validator_page_non_int_warning_and_key_removed() -> None:
+def test_validator_outside_period_flags_the_right_tx_after_a_drop() -> None:
     statement = _base_statement()
-    statement["transactions"][0]["page"] = "one"
+    base_tx = statement["transactions"][0]
+    statement["transactions"] = [
+        dict(base_tx, fitid="BAD", posted_at="2024-03-01", amount="not-a-number"),
+        dict(base_tx, fitid="IN", posted_at="2024-01-10"),
+        dict(base_tx, fitid="OUT", posted_at="2024-02-15"),
+    ]
     result = validate_statement(statement)
-    assert len(result.statement["transactions"]) == 1
-    assert "page" not in result.statement["transactions"][0]
-    assert any("transaction page invalid" in issue.reason for issue in result.issues)
+    assert [tx["fitid"] for tx in result.statement["transactions"]] == ["IN", "OUT"]
+    outside = [i for i in result.issues if i.reason == "transaction outside statement period"]
+    assert len(outside) == 1
+    assert outside[0].fitids == ["OUT"]